@@ -5,6 +5,7 @@ Orchestrates the cube state (model), 3D renderer (view), and UI panel.
 Handles keyboard input for manual mode and AI solve sequencing.
 """
 
+import queue
 import threading
 import time
 from ursina import *
@@ -34,6 +35,12 @@ _PHASE2_DESC = (
     "et des rotations sur U, D."
 )
 
+# (title, description) indexed by phase: 0 = phase 1, 1 = phase 2
+_PHASE_META = (
+    (_PHASE1_TITLE, _PHASE1_DESC),
+    (_PHASE2_TITLE, _PHASE2_DESC),
+)
+
 
 class AppController:
     """Central controller linking model, view, and UI."""
@@ -45,6 +52,12 @@ class AppController:
         self._solving = False
         self._solution = None
         self._phase1_length = 0
+        self._n_moves = 0
+        # (phase_title, phase_desc, move_text) for each solution step
+        self._step_meta = []
+        # Solver thread -> main thread messages, drained every frame in update()
+        self._solution_queue = queue.SimpleQueue()
+        self._best_result = None
 
     def handle_input(self, key):
         """Handle keyboard input for manual cube moves."""
@@ -70,7 +83,7 @@ class AppController:
         if move:
             self.state.apply_move(move)
             self.renderer.animate_move(move, callback=self._check_solved)
-            self.ui.set_moves_display(' '.join(self.state.move_history[-20:]))
+            self.ui.set_moves_display(self.state.recent_moves_str)
 
     def scramble(self):
         """Scramble the cube."""
@@ -99,20 +112,40 @@ class AppController:
 
         self._solving = True
         self._solve_start = time.time()
+        self._best_result = None
         self.ui.set_status('Resolution en cours...')
 
-        # Run solver in a background thread to avoid freezing the UI
+        # Run solver in a background thread to avoid freezing the UI.
+        # Each shorter solution found is queued as it arrives.
         def solve_thread():
             try:
-                solution = self.state.solve(max_length=23, timeout=30)
-                # Schedule UI update on main thread
-                invoke(self._on_solve_complete, solution, delay=0)
+                for result in self.state.solve_iter(max_length=23, timeout=30):
+                    self._solution_queue.put(('candidate', result))
+                self._solution_queue.put(('done', None))
             except Exception as e:
-                invoke(self._on_solve_error, str(e), delay=0)
+                self._solution_queue.put(('error', str(e)))
 
         t = threading.Thread(target=solve_thread, daemon=True)
         t.start()
 
+    def update(self):
+        """Drain solver messages and apply the frame's UI text changes.
+        Called every frame from main.py's update().
+        """
+        while not self._solution_queue.empty():
+            kind, payload = self._solution_queue.get()
+            if kind == 'candidate':
+                self._best_result = payload
+                n = len(payload["moves"])
+                self.ui.set_status(
+                    f'Solution trouvee: {n} mouvements. Recherche plus courte...')
+                self.ui.set_moves_display(' '.join(payload["moves"]))
+            elif kind == 'done':
+                self._on_solve_complete(self._best_result)
+            else:
+                self._on_solve_error(payload)
+        self.ui.flush()
+
     def _on_solve_complete(self, result):
         if result is None:
             self._solving = False
@@ -122,53 +155,55 @@ class AppController:
         solution = result["moves"]
         self._phase1_length = result["phase1_length"]
         self._solution = solution
-        n = len(solution)
+        self._n_moves = n = len(solution)
         self.ui.set_status(f'Solution trouvee: {n} mouvements. Animation...')
         self.ui.set_moves_display(' '.join(solution))
+        self._step_meta = self._build_step_meta(solution, self._phase1_length)
 
-        phase1_len = self._phase1_length
-        phase2_len = n - phase1_len
-
-        def on_step(current, total, move):
-            self.ui.set_step_display(current, total)
-            # Apply move to logical state
-            self.state.apply_move(move)
-
-            idx = current - 1  # 0-based index
-            if idx < phase1_len:
-                phase_title = _PHASE1_TITLE
-                phase_desc = _PHASE1_DESC
-                step_in_phase = idx + 1
-                phase_total = phase1_len
-            else:
-                phase_title = _PHASE2_TITLE
-                phase_desc = _PHASE2_DESC
-                step_in_phase = idx - phase1_len + 1
-                phase_total = phase2_len
+        self.ui.playing = True
+        self.ui.show_playback_controls()
+        self.renderer.animate_sequence(
+            solution,
+            on_complete=self._on_solve_done,
+            step_callback=self._on_solve_step,
+        )
 
-            phase_num = 1 if idx < phase1_len else 2
-            progress = f"Phase {phase_num} : {step_in_phase}/{phase_total}"
+    @staticmethod
+    def _build_step_meta(solution, phase1_len):
+        """Precompute the phase texts shown for each step of the animation."""
+        phase_lens = (phase1_len, len(solution) - phase1_len)
+        meta = []
+        for idx, move in enumerate(solution):
+            phase = int(idx >= phase1_len)  # 0 = phase 1, 1 = phase 2
+            phase_title, phase_desc = _PHASE_META[phase]
+            step_in_phase = idx + 1 - phase * phase1_len
+            progress = f"Phase {phase + 1} : {step_in_phase}/{phase_lens[phase]}"
             move_desc = _MOVE_FR.get(move, move)
-            move_text = f"{move}  -  {move_desc}   [{progress}]"
+            meta.append((phase_title, phase_desc,
+                         f"{move}  -  {move_desc}   [{progress}]"))
+        return meta
 
-            self.ui.set_phase_display(phase_title, phase_desc)
-            self.ui.set_move_description(move_text)
+    def _on_solve_step(self, current, total, move):
+        # Apply move to logical state
+        self.state.apply_move(move)
 
-        def on_done():
-            self._solving = False
-            elapsed = time.time() - self._solve_start
-            if self.state.is_solved():
-                self.ui.set_status(f'Cube RESOLU en {n} coups en {elapsed:.1f}s !')
-            else:
-                self.ui.set_status('Animation terminee.')
-            self.ui.set_phase_display('', '')
-            self.ui.set_move_description('')
+        phase_title, phase_desc, move_text = self._step_meta[current - 1]
+        self.ui.update_progress(current, total, phase_title, phase_desc,
+                                move_text)
 
-        self.renderer.animate_sequence(
-            solution,
-            on_complete=on_done,
-            step_callback=on_step,
-        )
+    def _on_solve_done(self):
+        self._solving = False
+        elapsed = time.time() - self._solve_start
+        if self.state.is_solved():
+            self.ui.set_status(
+                f'Cube RESOLU en {self._n_moves} coups en {elapsed:.1f}s !')
+        else:
+            self.ui.set_status('Animation terminee.')
+        self.ui.set_phase_display('', '')
+        self.ui.set_move_description('')
+        self.ui.playing = False
+        if self.ui.mode == 'Manuel':
+            self.ui.hide_playback_controls()
 
     def _on_solve_error(self, error_msg):
         self._solving = False
@@ -191,7 +226,7 @@ class AppController:
         if last:
             inv = self.state._inverse_move(last)
             self.renderer.animate_move(inv)
-            self.ui.set_moves_display(' '.join(self.state.move_history[-20:]))
+            self.ui.set_moves_display(self.state.recent_moves_str)
 
     def set_speed(self, speed):
         self.renderer.set_speed(speed)
@@ -8,14 +8,19 @@ Controls:
 
 import sys
 import os
+import subprocess
 import threading
 
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, ROOT_DIR)
 
 from ursina import *
 
-# Pre-load solver tables in background
+# Pre-load solver tables in background. Missing tables are generated in a
+# separate process (python -m solver) so the CPU-heavy build never holds the
+# GIL of the render loop; this thread only waits, then loads the cache.
 def _preload_tables():
+    subprocess.run([sys.executable, "-m", "solver"], cwd=ROOT_DIR)
     from solver.solver import initialize
     initialize()
     print("[Solver] Tables chargees.")
@@ -88,4 +93,7 @@ controller = AppController(game_state, renderer, ui)
 def input(key):
     controller.handle_input(key)
 
+def update():
+    controller.update()
+
 app.run()
@@ -3,11 +3,19 @@ Game-level cube state that bridges the solver and the view.
 Manages the logical state and dispatches moves.
 """
 
+from collections import deque
+
 from solver.cube_model import CubieCube, MOVE_CUBES, MOVE_NAMES
 
 
 MOVE_MAP = {name: i for i, name in enumerate(MOVE_NAMES)}
 
+# Number of recent moves shown in the UI
+RECENT_MOVES = 20
+
+# Move name -> move CubieCube, so dispatch is a single dict lookup
+_NAME_TO_CUBE = {name: MOVE_CUBES[i] for i, name in enumerate(MOVE_NAMES)}
+
 
 class GameCubeState:
     """High-level cube state for the application."""
@@ -15,43 +23,59 @@ class GameCubeState:
     def __init__(self):
         self.cube = CubieCube()
         self.move_history = []
+        # Mirror of the last RECENT_MOVES moves and its lazily joined string
+        self._recent = deque(maxlen=RECENT_MOVES)
+        self._recent_str = ''
+        # to_facelet_string() / is_solved() of the current cube, cleared
+        # by _cube_changed() on every change
+        self._facelet_cache = None
+        self._solved_cache = None
         self._on_move_callbacks = []
         self._on_state_change_callbacks = []
 
     def reset(self):
         self.cube = CubieCube()
-        self.move_history.clear()
+        self._clear_history()
         self._notify_state_change()
 
     def apply_move(self, move_name):
         """Apply a move by name (e.g. 'R', "U'", 'F2')."""
-        if move_name not in MOVE_MAP:
+        move_cube = _NAME_TO_CUBE.get(move_name)
+        if move_cube is None:
             raise ValueError(f"Unknown move: {move_name}")
-        idx = MOVE_MAP[move_name]
-        self.cube.apply_move(MOVE_CUBES[idx])
+        self.cube.apply_move(move_cube)
         self.move_history.append(move_name)
-        self._notify_move(move_name)
+        self._recent.append(move_name)
+        self._recent_str = None
+        self._cube_changed()
+        if self._on_move_callbacks:
+            self._notify_move(move_name)
 
     def undo(self):
         """Undo the last move."""
         if not self.move_history:
             return None
         last = self.move_history.pop()
+        self._recent = deque(self.move_history[-RECENT_MOVES:], maxlen=RECENT_MOVES)
+        self._recent_str = None
         # Apply the inverse move
         inv = self._inverse_move(last)
-        idx = MOVE_MAP[inv]
-        self.cube.apply_move(MOVE_CUBES[idx])
+        self.cube.apply_move(_NAME_TO_CUBE[inv])
+        self._cube_changed()
         self._notify_state_change()
         return last
 
     def is_solved(self):
-        return self.cube.is_solved()
+        """Whether the cube is solved (cached until the next change)."""
+        if self._solved_cache is None:
+            self._solved_cache = self.cube.is_solved()
+        return self._solved_cache
 
     def scramble(self, n_moves=20):
         """Scramble the cube. Returns the list of scramble moves."""
         from solver.solver import scramble as do_scramble
         self.cube, moves = do_scramble(n_moves)
-        self.move_history.clear()
+        self._clear_history()
         self._notify_state_change()
         return moves
 
@@ -60,14 +84,39 @@ class GameCubeState:
         from solver.solver import solve
         return solve(self.cube, max_length=max_length, timeout=timeout)
 
+    def solve_iter(self, max_length=23, timeout=30):
+        """Yield successively shorter solutions of the current state (dicts as in solve())."""
+        from solver.solver import solve_iter
+        return solve_iter(self.cube, max_length=max_length, timeout=timeout)
+
     def get_facelet_string(self):
-        return self.cube.to_facelet_string()
+        """Facelet string of the current state (cached until the next change)."""
+        if self._facelet_cache is None:
+            self._facelet_cache = self.cube.to_facelet_string()
+        return self._facelet_cache
 
     def set_from_facelet_string(self, s):
         self.cube = CubieCube.from_facelet_string(s)
-        self.move_history.clear()
+        self._clear_history()
         self._notify_state_change()
 
+    @property
+    def recent_moves_str(self):
+        """The last RECENT_MOVES moves joined with spaces (cached)."""
+        if self._recent_str is None:
+            self._recent_str = ' '.join(self._recent)
+        return self._recent_str
+
+    def _clear_history(self):
+        self.move_history.clear()
+        self._recent.clear()
+        self._recent_str = ''
+        self._cube_changed()
+
+    def _cube_changed(self):
+        self._facelet_cache = None
+        self._solved_cache = None
+
     def on_move(self, callback):
         """Register callback(move_name) called after each move."""
         self._on_move_callbacks.append(callback)
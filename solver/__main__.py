@@ -0,0 +1,17 @@
+"""
+Build and cache all solver tables.
+
+Usage:
+    python -m solver
+
+Run by main.py in a child process on startup so that first-run table
+generation does not compete with the render loop for the GIL.
+"""
+
+from .pruning_tables import warm_all
+from .solver import initialize
+
+if __name__ == "__main__":
+    # Missing pruning tables are built in parallel first (see warm_all())
+    warm_all()
+    initialize()
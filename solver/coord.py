@@ -12,23 +12,16 @@ Phase 2 coordinates:
 - udslice_sorted: Permutation of the 4 UD-slice edges in their positions (0..23), 4! values
 """
 
+from math import comb
+
 from .cube_model import CubieCube, MOVE_CUBES, FR, FL, BL, BR
 
 # ---------------------------------------------------------------------------
 # Combinatorial helpers
 # ---------------------------------------------------------------------------
 
-def _cnk(n, k):
-    """Binomial coefficient C(n, k)."""
-    if k < 0 or k > n:
-        return 0
-    if k == 0 or k == n:
-        return 1
-    k = min(k, n - k)
-    result = 1
-    for i in range(k):
-        result = result * (n - i) // (i + 1)
-    return result
+# Binomial coefficients C(n, k) for 0 <= n, k <= 13 (0 when k > n)
+_CNK = tuple(tuple(comb(n, k) for k in range(14)) for n in range(14))
 
 
 _FACTORIAL = [1]
@@ -40,27 +33,38 @@ def _perm_to_index(perm):
     """Convert a permutation to its Lehmer code index.
     perm is a list of distinct integers 0..n-1.
     Returns an index in range [0, n!).
+
+    The Lehmer digit of perm[i] is the number of smaller values not yet seen,
+    i.e. perm[i] minus the popcount of the already-seen values below it.
     """
     n = len(perm)
-    p = list(perm)
     index = 0
+    seen = 0
     for i in range(n):
-        index += p[i] * _FACTORIAL[n - 1 - i]
-        for j in range(i + 1, n):
-            if p[j] > p[i]:
-                p[j] -= 1
+        v = perm[i]
+        index += (v - (seen & ((1 << v) - 1)).bit_count()) * _FACTORIAL[n - 1 - i]
+        seen |= 1 << v
     return index
 
 
+# _SET_BITS[mask] = ascending positions of the set bits of an 8-bit mask
+_SET_BITS = tuple(tuple(b for b in range(8) if mask >> b & 1) for mask in range(256))
+
+
 def _index_to_perm(index, n):
-    """Convert a Lehmer code index to a permutation of n elements."""
+    """Convert a Lehmer code index to a permutation of n elements (n <= 8).
+
+    Remaining values are tracked as a bitmask; the k-th smallest one is
+    read from _SET_BITS instead of removing it from a list.
+    """
     perm = [0] * n
-    elements = list(range(n))
+    avail = (1 << n) - 1
     for i in range(n):
         fact = _FACTORIAL[n - 1 - i]
-        perm[i] = elements[index // fact]
-        elements.remove(perm[i])
+        v = _SET_BITS[avail][index // fact]
         index %= fact
+        perm[i] = v
+        avail ^= 1 << v
     return perm
 
 
@@ -74,20 +78,37 @@ N_TWIST = 2187  # 3^7
 
 def get_twist(cube):
     """Extract twist coordinate from CubieCube."""
-    twist = 0
-    for i in range(7):
-        twist = twist * 3 + cube.co[i]
-    return twist
+    return twist_from_co(cube.co)
+
+
+def twist_from_co(co):
+    """Twist coordinate of a corner orientation vector (base-3 Horner over co[0..6])."""
+    return ((((((co[0] * 3 + co[1]) * 3 + co[2]) * 3 + co[3]) * 3 + co[4])
+             * 3 + co[5]) * 3 + co[6])
 
 
 def set_twist(cube, twist):
     """Set corner orientation of CubieCube from twist coordinate."""
-    parity = 0
+    cube.co[:] = _TWIST_CO[twist]
+
+
+def all_twist_co():
+    """Corner orientation vectors of every twist coordinate, as N_TWIST 8-tuples.
+
+    Decodes all coordinates at once, one base-3 digit column at a time, so
+    table generation can work on orientation rows without any CubieCube.
+    """
+    t = list(range(N_TWIST))
+    cols = [None] * 8
     for i in range(6, -1, -1):
-        cube.co[i] = twist % 3
-        parity += cube.co[i]
-        twist //= 3
-    cube.co[7] = (3 - parity % 3) % 3
+        cols[i] = [x % 3 for x in t]
+        t = [x // 3 for x in t]
+    cols[7] = [(3 - sum(digits) % 3) % 3 for digits in zip(*cols[:7])]
+    return list(zip(*cols))
+
+
+# Decoded corner orientations (parity digit included), indexed by twist
+_TWIST_CO = all_twist_co()
 
 
 def twist_to_cube(twist):
@@ -103,20 +124,36 @@ N_FLIP = 2048  # 2^11
 
 def get_flip(cube):
     """Extract flip coordinate from CubieCube."""
-    flip = 0
-    for i in range(11):
-        flip = flip * 2 + cube.eo[i]
-    return flip
+    return flip_from_eo(cube.eo)
+
+
+def flip_from_eo(eo):
+    """Flip coordinate of an edge orientation vector (base-2 Horner over eo[0..10])."""
+    return ((((((((((eo[0] * 2 + eo[1]) * 2 + eo[2]) * 2 + eo[3]) * 2 + eo[4])
+                * 2 + eo[5]) * 2 + eo[6]) * 2 + eo[7]) * 2 + eo[8])
+             * 2 + eo[9]) * 2 + eo[10])
 
 
 def set_flip(cube, flip):
     """Set edge orientation of CubieCube from flip coordinate."""
-    parity = 0
-    for i in range(10, -1, -1):
-        cube.eo[i] = flip % 2
-        parity += cube.eo[i]
-        flip //= 2
-    cube.eo[11] = (2 - parity % 2) % 2
+    cube.eo[:] = _FLIP_EO[flip]
+
+
+def all_flip_eo():
+    """Edge orientation vectors of every flip coordinate, as N_FLIP 12-tuples.
+
+    Decoded one bit column at a time, like all_twist_co().
+    """
+    cols = [None] * 12
+    for i in range(11):
+        shift = 10 - i
+        cols[i] = [(x >> shift) & 1 for x in range(N_FLIP)]
+    cols[11] = [sum(bits) & 1 for bits in zip(*cols[:11])]
+    return list(zip(*cols))
+
+
+# Decoded edge orientations (parity bit included), indexed by flip
+_FLIP_EO = all_flip_eo()
 
 
 def flip_to_cube(flip):
@@ -135,10 +172,15 @@ def get_udslice(cube):
     """Extract udslice coordinate (0 = solved, UD-slice edges at positions 8-11).
     Encodes which 4 of the 12 edge positions hold a UD-slice edge (FR/FL/BL/BR).
     """
-    # Find positions occupied by UD-slice edges (sorted ascending)
-    occ = [i for i in range(12) if cube.ep[i] >= 8]
-    # Combinatorial number system encoding
-    raw = sum(_cnk(occ[k], k + 1) for k in range(4))
+    # Combinatorial number system encoding of the occupied positions,
+    # accumulated in a single ascending pass (the k-th one adds C(i, k))
+    ep = cube.ep
+    raw = 0
+    k = 1
+    for i in range(12):
+        if ep[i] >= 8:
+            raw += _CNK[i][k]
+            k += 1
     # Reverse so that solved position (8,9,10,11) gives index 0
     return N_UDSLICE - 1 - raw
 
@@ -155,7 +197,7 @@ def set_udslice(cube, index):
     occupied = [False] * 12
     k = 3
     for i in range(11, -1, -1):
-        c = _cnk(i, k + 1)
+        c = _CNK[i][k + 1]
         if raw >= c:
             raw -= c
             occupied[i] = True
@@ -94,17 +94,67 @@ EDGE_COLORS = [
 ]
 
 
+# Precomputed stickers for to_facelet_string():
+# _CORNER_STICKERS[pos][cubie][ori] = ((facelet, color char), ...) for the
+# 3 facelets of corner position pos holding that cubie with that orientation;
+# _EDGE_STICKERS likewise with 2 facelets per edge.
+_CORNER_STICKERS = tuple(
+    tuple(
+        tuple(
+            tuple((CORNER_FACELETS[pos][(k + 3 - ori) % 3], COLOR_CHARS[CORNER_COLORS[cubie][k]])
+                  for k in range(3))
+            for ori in range(3))
+        for cubie in range(8))
+    for pos in range(8))
+_EDGE_STICKERS = tuple(
+    tuple(
+        tuple(
+            tuple((EDGE_FACELETS[pos][(k + ori) % 2], COLOR_CHARS[EDGE_COLORS[cubie][k]])
+                  for k in range(2))
+            for ori in range(2))
+        for cubie in range(12))
+    for pos in range(12))
+# Inverse lookups for from_facelet_string(): the colors read clockwise from
+# the U/D facelet (corners) or primary facelet (edges) -> (cubie, orientation)
+_CORNER_LOOKUP = {
+    (tc[ori % 3], tc[(1 + ori) % 3], tc[(2 + ori) % 3]): (cubie, ori)
+    for cubie, tc in enumerate(CORNER_COLORS)
+    for ori in range(3)
+}
+_EDGE_LOOKUP = {}
+for _cubie, (_a, _b) in enumerate(EDGE_COLORS):
+    _EDGE_LOOKUP[(_a, _b)] = (_cubie, 0)
+    _EDGE_LOOKUP[(_b, _a)] = (_cubie, 1)
+_COLOR_INDEX = {c: i for i, c in enumerate(COLOR_CHARS)}
+# Center facelets are always fixed; the other entries are always overwritten
+_FACELET_TEMPLATE = tuple(COLOR_CHARS[i // 9] if i % 9 == 4 else "" for i in range(54))
+
+
+# Solved-state arrays shared by is_solved() and validate(), and copied by
+# CubieCube() for its default state (never mutated)
+_SOLVED_CP = list(range(8))
+_SOLVED_CO = [0] * 8
+_SOLVED_EP = list(range(12))
+_SOLVED_EO = [0] * 12
+
+# _MOD3[x] = x % 3 for the sum of two corner orientations (0..4)
+_MOD3 = (0, 1, 2, 0, 1)
+
+
 # ---------------------------------------------------------------------------
 # CubieCube class
 # ---------------------------------------------------------------------------
 class CubieCube:
     """Represents a Rubik's cube state at the cubie level."""
 
+    # Fixed storage: no per-instance __dict__, faster attribute access
+    __slots__ = ("cp", "co", "ep", "eo")
+
     def __init__(self, cp=None, co=None, ep=None, eo=None):
-        self.cp = list(cp) if cp else list(range(8))
-        self.co = list(co) if co else [0] * 8
-        self.ep = list(ep) if ep else list(range(12))
-        self.eo = list(eo) if eo else [0] * 12
+        self.cp = list(cp) if cp else _SOLVED_CP.copy()
+        self.co = list(co) if co else _SOLVED_CO.copy()
+        self.ep = list(ep) if ep else _SOLVED_EP.copy()
+        self.eo = list(eo) if eo else _SOLVED_EO.copy()
 
     def copy(self):
         return CubieCube(self.cp, self.co, self.ep, self.eo)
@@ -116,31 +166,36 @@ class CubieCube:
         This means other's permutation is applied first to determine which
         position in self's result to read from.
         """
-        result = CubieCube()
-        for i in range(8):
-            result.cp[i] = self.cp[other.cp[i]]
-            result.co[i] = (self.co[other.cp[i]] + other.co[i]) % 3
-        for i in range(12):
-            result.ep[i] = self.ep[other.ep[i]]
-            result.eo[i] = (self.eo[other.ep[i]] + other.eo[i]) % 2
+        # apply_move() only reads self's arrays and rebinds new ones, so the
+        # result can start out sharing them instead of copying.
+        result = CubieCube.__new__(CubieCube)
+        result.cp, result.co, result.ep, result.eo = self.cp, self.co, self.ep, self.eo
+        result.apply_move(other)
         return result
 
     def apply_move(self, move_cube):
-        """Apply a move (given as CubieCube) to this state. Modifies in place."""
-        new_cp = [0] * 8
-        new_co = [0] * 8
-        new_ep = [0] * 12
-        new_eo = [0] * 12
-        for i in range(8):
-            new_cp[i] = self.cp[move_cube.cp[i]]
-            new_co[i] = (self.co[move_cube.cp[i]] + move_cube.co[i]) % 3
-        for i in range(12):
-            new_ep[i] = self.ep[move_cube.ep[i]]
-            new_eo[i] = (self.eo[move_cube.ep[i]] + move_cube.eo[i]) % 2
-        self.cp = new_cp
-        self.co = new_co
-        self.ep = new_ep
-        self.eo = new_eo
+        """Apply a move (given as CubieCube) to this state. Modifies in place.
+
+        Fused and fully unrolled: the move's permutation indices are unpacked
+        once and shared by the permutation and orientation updates, with no
+        Python-level loop. Orientations are reduced through lookup tables
+        (_MOD3, and XOR for edges) rather than the slower % operator.
+        """
+        cp, co, ep, eo = self.cp, self.co, self.ep, self.eo
+        a0, a1, a2, a3, a4, a5, a6, a7 = move_cube.cp
+        o0, o1, o2, o3, o4, o5, o6, o7 = move_cube.co
+        self.cp = [cp[a0], cp[a1], cp[a2], cp[a3], cp[a4], cp[a5], cp[a6], cp[a7]]
+        mod3 = _MOD3
+        self.co = [mod3[co[a0] + o0], mod3[co[a1] + o1], mod3[co[a2] + o2],
+                   mod3[co[a3] + o3], mod3[co[a4] + o4], mod3[co[a5] + o5],
+                   mod3[co[a6] + o6], mod3[co[a7] + o7]]
+        b0, b1, b2, b3, b4, b5, b6, b7, b8, b9, b10, b11 = move_cube.ep
+        f0, f1, f2, f3, f4, f5, f6, f7, f8, f9, f10, f11 = move_cube.eo
+        self.ep = [ep[b0], ep[b1], ep[b2], ep[b3], ep[b4], ep[b5],
+                   ep[b6], ep[b7], ep[b8], ep[b9], ep[b10], ep[b11]]
+        self.eo = [eo[b0] ^ f0, eo[b1] ^ f1, eo[b2] ^ f2, eo[b3] ^ f3,
+                   eo[b4] ^ f4, eo[b5] ^ f5, eo[b6] ^ f6, eo[b7] ^ f7,
+                   eo[b8] ^ f8, eo[b9] ^ f9, eo[b10] ^ f10, eo[b11] ^ f11]
 
     def inverse(self):
         """Return the inverse of this cube state."""
@@ -154,8 +209,8 @@ class CubieCube:
         return inv
 
     def is_solved(self):
-        return (self.cp == list(range(8)) and self.co == [0] * 8
-                and self.ep == list(range(12)) and self.eo == [0] * 12)
+        return (self.cp == _SOLVED_CP and self.co == _SOLVED_CO
+                and self.ep == _SOLVED_EP and self.eo == _SOLVED_EO)
 
     def __eq__(self, other):
         return (self.cp == other.cp and self.co == other.co
@@ -169,28 +224,18 @@ class CubieCube:
     # -----------------------------------------------------------------------
     def to_facelet_string(self):
         """Convert cubie state to a 54-character facelet string (URFDLB order)."""
-        facelets = [0] * 54
-        # Center facelets are always fixed
-        for f in range(6):
-            facelets[f * 9 + 4] = f
-
-        # Corners
-        for i in range(8):
-            cubie = self.cp[i]
-            ori = self.co[i]
-            for k in range(3):
-                facelet_idx = CORNER_FACELETS[i][(k + 3 - ori) % 3]
-                facelets[facelet_idx] = CORNER_COLORS[cubie][k]
-
-        # Edges
-        for i in range(12):
-            cubie = self.ep[i]
-            ori = self.eo[i]
-            for k in range(2):
-                facelet_idx = EDGE_FACELETS[i][(k + ori) % 2]
-                facelets[facelet_idx] = EDGE_COLORS[cubie][k]
-
-        return "".join(COLOR_CHARS[c] for c in facelets)
+        facelets = list(_FACELET_TEMPLATE)
+        # Each (position, cubie, orientation) maps to precomputed stickers
+        for stickers, cubie, ori in zip(_CORNER_STICKERS, self.cp, self.co):
+            (f0, c0), (f1, c1), (f2, c2) = stickers[cubie][ori]
+            facelets[f0] = c0
+            facelets[f1] = c1
+            facelets[f2] = c2
+        for stickers, cubie, ori in zip(_EDGE_STICKERS, self.ep, self.eo):
+            (f0, c0), (f1, c1) = stickers[cubie][ori]
+            facelets[f0] = c0
+            facelets[f1] = c1
+        return "".join(facelets)
 
     @classmethod
     def from_facelet_string(cls, s):
@@ -201,71 +246,43 @@ class CubieCube:
         if len(s) != 54:
             raise ValueError(f"Facelet string must be 54 characters, got {len(s)}")
 
-        color_map = {c: i for i, c in enumerate(COLOR_CHARS)}
         facelets = []
         for ch in s:
-            if ch not in color_map:
+            if ch not in _COLOR_INDEX:
                 raise ValueError(f"Invalid character '{ch}' in facelet string")
-            facelets.append(color_map[ch])
+            facelets.append(_COLOR_INDEX[ch])
 
         cube = cls()
 
-        # Decode corners
+        # Decode corners: one lookup per corner gives its cubie and orientation
         for i in range(8):
             f0, f1, f2 = CORNER_FACELETS[i]
-            c0, c1, c2 = facelets[f0], facelets[f1], facelets[f2]
-            colors = (c0, c1, c2)
-
-            # Find which corner cubie this is and its orientation
-            found = False
-            for j in range(8):
-                tc = CORNER_COLORS[j]
-                # Try each orientation
-                for ori in range(3):
-                    if (colors[0] == tc[(0 + ori) % 3]
-                            and colors[1] == tc[(1 + ori) % 3]
-                            and colors[2] == tc[(2 + ori) % 3]):
-                        cube.cp[i] = j
-                        cube.co[i] = ori
-                        found = True
-                        break
-                if found:
-                    break
-            if not found:
+            colors = (facelets[f0], facelets[f1], facelets[f2])
+            found = _CORNER_LOOKUP.get(colors)
+            if found is None:
                 raise ValueError(f"Invalid corner at position {CORNER_NAMES[i]}: "
                                  f"colors {tuple(COLOR_CHARS[c] for c in colors)}")
+            cube.cp[i], cube.co[i] = found
 
         # Decode edges
         for i in range(12):
             f0, f1 = EDGE_FACELETS[i]
             c0, c1 = facelets[f0], facelets[f1]
-
-            found = False
-            for j in range(12):
-                te = EDGE_COLORS[j]
-                if c0 == te[0] and c1 == te[1]:
-                    cube.ep[i] = j
-                    cube.eo[i] = 0
-                    found = True
-                    break
-                elif c0 == te[1] and c1 == te[0]:
-                    cube.ep[i] = j
-                    cube.eo[i] = 1
-                    found = True
-                    break
-            if not found:
+            found = _EDGE_LOOKUP.get((c0, c1))
+            if found is None:
                 raise ValueError(f"Invalid edge at position {EDGE_NAMES[i]}: "
                                  f"colors ({COLOR_CHARS[c0]}, {COLOR_CHARS[c1]})")
+            cube.ep[i], cube.eo[i] = found
 
         return cube
 
     def validate(self):
         """Check if this is a valid, solvable cube state. Returns error message or None."""
         # Check corner permutation
-        if sorted(self.cp) != list(range(8)):
+        if sorted(self.cp) != _SOLVED_CP:
             return "Invalid corner permutation"
         # Check edge permutation
-        if sorted(self.ep) != list(range(12)):
+        if sorted(self.ep) != _SOLVED_EP:
             return "Invalid edge permutation"
         # Check corner orientation sum
         if sum(self.co) % 3 != 0:
@@ -282,22 +299,17 @@ class CubieCube:
 
 
 def _perm_parity(perm):
-    """Return 0 for even permutation, 1 for odd."""
-    n = len(perm)
-    visited = [False] * n
-    parity = 0
-    for i in range(n):
-        if not visited[i]:
-            visited[i] = True
-            j = perm[i]
-            cycle_len = 1
-            while j != i:
-                visited[j] = True
-                j = perm[j]
-                cycle_len += 1
-            if cycle_len % 2 == 0:
-                parity ^= 1
-    return parity
+    """Return 0 for even permutation, 1 for odd.
+
+    The parity of the inversion count: each value is inverted with the
+    larger values already seen, counted with one popcount of a bitmask.
+    """
+    seen = 0
+    inversions = 0
+    for v in perm:
+        inversions += (seen >> v).bit_count()
+        seen |= 1 << v
+    return inversions & 1
 
 
 # ---------------------------------------------------------------------------
@@ -371,6 +383,13 @@ for m in BASIC_MOVES:
     MOVE_CUBES.append(m2)
     MOVE_CUBES.append(m3)
 
+# The same 18 moves split into flat per-part tuples (MOVE_CP[i] == MOVE_CUBES[i].cp),
+# for table generators that only need one part of each move
+MOVE_CP = tuple(tuple(m.cp) for m in MOVE_CUBES)
+MOVE_CO = tuple(tuple(m.co) for m in MOVE_CUBES)
+MOVE_EP = tuple(tuple(m.ep) for m in MOVE_CUBES)
+MOVE_EO = tuple(tuple(m.eo) for m in MOVE_CUBES)
+
 # Move name strings
 MOVE_NAMES = []
 for face in ["U", "R", "F", "D", "L", "B"]:
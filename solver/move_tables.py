@@ -3,174 +3,174 @@ Move tables for the Two-Phase algorithm.
 
 For each coordinate and each of the 18 moves, pre-compute the resulting coordinate.
 Tables are generated once and cached to disk for subsequent runs.
+
+Each table is a flat, contiguous array of uint16 ('H') in row-major order:
+the entry for coordinate c and move m is table[c * n_moves + m], with
+n_moves = 18 for phase 1 tables and 10 (PHASE2_MOVES) for phase 2 tables.
 """
 
-import os
-import pickle
+from array import array
+from itertools import permutations
+from operator import add, itemgetter
 
-from .cube_model import CubieCube, MOVE_CUBES, PHASE2_MOVES
+from .cube_model import (
+    CubieCube, MOVE_CP, MOVE_CO, MOVE_EP, MOVE_EO, PHASE2_MOVES,
+)
 from . import coord
-
-CACHE_DIR = os.path.join(os.path.dirname(__file__), "tables_cache")
+from .tables import load_or_build
 
 
-def _cache_path(name):
-    os.makedirs(CACHE_DIR, exist_ok=True)
-    return os.path.join(CACHE_DIR, f"{name}.pkl")
+def _gen_shuffle_move(rows, shuffles):
+    """table[i * len(shuffles) + m] = index of shuffles[m](rows[i]) among rows.
 
-
-def _load_or_generate(name, generator):
-    path = _cache_path(name)
-    if os.path.exists(path):
-        with open(path, "rb") as f:
-            return pickle.load(f)
-    table = generator()
-    with open(path, "wb") as f:
-        pickle.dump(table, f, protocol=pickle.HIGHEST_PROTOCOL)
-    return table
+    rows[i] describes coordinate i position by position, and each move is
+    an itemgetter over its permutation, so applying it is a single shuffle
+    done in C. The result is indexed through a dict instead of re-encoding
+    it in Python.
+    """
+    index = {row: i for i, row in enumerate(rows)}
+    return array('H', [index[shuffle(row)] for row in rows for shuffle in shuffles])
 
 
 # ===========================================================================
 # Phase 1 move tables
 # ===========================================================================
 
-def _gen_twist_move():
-    """twist_move[twist][move] = new_twist after applying move."""
-    table = [[0] * 18 for _ in range(coord.N_TWIST)]
-    c = CubieCube()
-    for i in range(coord.N_TWIST):
-        coord.set_twist(c, i)
-        for m in range(18):
-            cc = c.copy()
-            cc.apply_move(MOVE_CUBES[m])
-            table[i][m] = coord.get_twist(cc)
-        # Reset for next iteration
-        c.co = [0] * 8
+def _gen_orient_move(rows, move_perms, move_oris, base):
+    """table[i * n_moves + m] = orientation coordinate of rows[i] after move m.
+
+    rows[i] is the orientation vector of coordinate i (parity digit last) and
+    the coordinate is its leading digits read in the given base. Moves are
+    composed one move at a time over the whole batch of rows: each output
+    digit column gathers an input column through a small lookup table that
+    folds the orientation change, the modulo and the digit weight, and the
+    columns are summed with map(), so the work stays in C.
+    """
+    cols = list(zip(*rows))
+    n_digits = len(cols) - 1
+    n_moves = len(move_perms)
+    table = array('H', bytes(2 * len(rows) * n_moves))
+    for m, (perm, ori) in enumerate(zip(move_perms, move_oris)):
+        coords = [0] * len(rows)
+        for j in range(n_digits):
+            weight = base ** (n_digits - 1 - j)
+            lut = [weight * ((d + ori[j]) % base) for d in range(base)]
+            coords = list(map(add, coords, map(lut.__getitem__, cols[perm[j]])))
+        table[m::n_moves] = array('H', coords)
     return table
 
 
+def _gen_twist_move():
+    """twist_move[twist * 18 + move] = new_twist after applying move.
+    Only corner orientation matters, so moves are applied to the decoded
+    orientation rows directly instead of to CubieCube copies.
+    """
+    return _gen_orient_move(coord._TWIST_CO, MOVE_CP, MOVE_CO, 3)
+
+
 def _gen_flip_move():
-    """flip_move[flip][move] = new_flip after applying move."""
-    table = [[0] * 18 for _ in range(coord.N_FLIP)]
-    c = CubieCube()
-    for i in range(coord.N_FLIP):
-        coord.set_flip(c, i)
-        for m in range(18):
-            cc = c.copy()
-            cc.apply_move(MOVE_CUBES[m])
-            table[i][m] = coord.get_flip(cc)
-        c.eo = [0] * 12
-    return table
+    """flip_move[flip * 18 + move] = new_flip after applying move.
+    Only edge orientation matters (see _gen_twist_move).
+    """
+    return _gen_orient_move(coord._FLIP_EO, MOVE_EP, MOVE_EO, 2)
 
 
 def _gen_udslice_move():
-    """udslice_move[udslice][move] = new_udslice after applying move."""
-    table = [[0] * 18 for _ in range(coord.N_UDSLICE)]
+    """udslice_move[udslice * 18 + move] = new_udslice after applying move.
+    Rows are the occupancy patterns (True where a UD-slice edge sits), in
+    coordinate order; see _gen_shuffle_move.
+    """
+    rows = []
     c = CubieCube()
     for i in range(coord.N_UDSLICE):
         coord.set_udslice(c, i)
-        for m in range(18):
-            cc = c.copy()
-            cc.apply_move(MOVE_CUBES[m])
-            table[i][m] = coord.get_udslice(cc)
-        # Reset
-        c.ep = list(range(12))
-    return table
+        rows.append(tuple(e >= 8 for e in c.ep))
+    return _gen_shuffle_move(rows, [itemgetter(*ep) for ep in MOVE_EP])
 
 
 # ===========================================================================
 # Phase 2 move tables
 # ===========================================================================
 
+def _gen_perm_move(n, shuffles):
+    """Move table over the permutations of range(n), indexed as in coord.
+    Permutation indices follow lexicographic order, so the rows are
+    itertools.permutations() in order.
+
+    The two 8! tables take ~0.12 s each to build this way and a few hundred
+    microseconds to load from their .bin files, so they are cached one file
+    per table like the others.
+    """
+    return _gen_shuffle_move(list(permutations(range(n))), shuffles)
+
+
 def _gen_cperm_move():
-    """cperm_move[cperm][move_index] = new_cperm.
+    """cperm_move[cperm * 10 + move_index] = new_cperm.
     Only phase 2 moves (10 moves).
     """
-    n_phase2 = len(PHASE2_MOVES)
-    table = [[0] * n_phase2 for _ in range(coord.N_CPERM)]
-    c = CubieCube()
-    for i in range(coord.N_CPERM):
-        coord.set_cperm(c, i)
-        for mi, m in enumerate(PHASE2_MOVES):
-            cc = c.copy()
-            cc.apply_move(MOVE_CUBES[m])
-            table[i][mi] = coord.get_cperm(cc)
-        c.cp = list(range(8))
-    return table
+    return _gen_perm_move(
+        8, [itemgetter(*MOVE_CP[m]) for m in PHASE2_MOVES])
 
 
 def _gen_ud_edges_move():
-    """ud_edges_move[ud_edges_perm][move_index] = new_ud_edges_perm.
-    Only phase 2 moves.
+    """ud_edges_move[ud_edges_perm * 10 + move_index] = new_ud_edges_perm.
+    Only phase 2 moves, which never move a U/D edge into the UD-slice, so
+    each one shuffles positions 0-7 among themselves.
     """
-    n_phase2 = len(PHASE2_MOVES)
-    table = [[0] * n_phase2 for _ in range(coord.N_UD_EDGES)]
-    c = CubieCube()
-    for i in range(coord.N_UD_EDGES):
-        coord.set_ud_edges_perm(c, i)
-        # UD-slice edges must be identity in positions 8-11 for phase 2
-        for k in range(4):
-            c.ep[8 + k] = 8 + k
-        for mi, m in enumerate(PHASE2_MOVES):
-            cc = c.copy()
-            cc.apply_move(MOVE_CUBES[m])
-            table[i][mi] = coord.get_ud_edges_perm(cc)
-        c.ep = list(range(12))
-    return table
+    return _gen_perm_move(
+        8, [itemgetter(*MOVE_EP[m][:8]) for m in PHASE2_MOVES])
 
 
 def _gen_udslice_sorted_move():
-    """udslice_sorted_move[udslice_sorted][move_index] = new_udslice_sorted.
-    Only phase 2 moves.
+    """udslice_sorted_move[udslice_sorted * 10 + move_index] = new_udslice_sorted.
+    Only phase 2 moves, which shuffle positions 8-11 among themselves.
     """
-    n_phase2 = len(PHASE2_MOVES)
-    table = [[0] * n_phase2 for _ in range(coord.N_UDSLICE_SORTED)]
-    c = CubieCube()
-    for i in range(coord.N_UDSLICE_SORTED):
-        # Set UD-edges to identity and only vary udslice_sorted
-        c.ep[:8] = list(range(8))
-        coord.set_udslice_sorted(c, i)
-        for mi, m in enumerate(PHASE2_MOVES):
-            cc = c.copy()
-            cc.apply_move(MOVE_CUBES[m])
-            table[i][mi] = coord.get_udslice_sorted(cc)
-        c.ep = list(range(12))
-    return table
+    return _gen_perm_move(
+        4, [itemgetter(*[p - 8 for p in MOVE_EP[m][8:]])
+            for m in PHASE2_MOVES])
 
 
 # ===========================================================================
 # Public API: lazy-loaded tables
 # ===========================================================================
 
+# Cache name and builder of each table, keyed like _tables
+_BUILDERS = {
+    "twist": ("twist_move", _gen_twist_move),
+    "flip": ("flip_move", _gen_flip_move),
+    "udslice": ("udslice_move", _gen_udslice_move),
+    "cperm": ("cperm_move", _gen_cperm_move),
+    "ud_edges": ("ud_edges_move", _gen_ud_edges_move),
+    "udslice_sorted": ("udslice_sorted_move", _gen_udslice_sorted_move),
+}
+
 _tables = {}
 
+def _get(key):
+    if key not in _tables:
+        _tables[key] = load_or_build(*_BUILDERS[key], typecode="H")
+    return _tables[key]
+
 def get_twist_move():
-    if "twist" not in _tables:
-        _tables["twist"] = _load_or_generate("twist_move", _gen_twist_move)
-    return _tables["twist"]
+    return _get("twist")
 
 def get_flip_move():
-    if "flip" not in _tables:
-        _tables["flip"] = _load_or_generate("flip_move", _gen_flip_move)
-    return _tables["flip"]
+    return _get("flip")
 
 def get_udslice_move():
-    if "udslice" not in _tables:
-        _tables["udslice"] = _load_or_generate("udslice_move", _gen_udslice_move)
-    return _tables["udslice"]
+    return _get("udslice")
 
 def get_cperm_move():
-    if "cperm" not in _tables:
-        _tables["cperm"] = _load_or_generate("cperm_move", _gen_cperm_move)
-    return _tables["cperm"]
+    return _get("cperm")
 
 def get_ud_edges_move():
-    if "ud_edges" not in _tables:
-        _tables["ud_edges"] = _load_or_generate("ud_edges_move", _gen_ud_edges_move)
-    return _tables["ud_edges"]
+    return _get("ud_edges")
 
 def get_udslice_sorted_move():
-    if "udslice_sorted" not in _tables:
-        _tables["udslice_sorted"] = _load_or_generate(
-            "udslice_sorted_move", _gen_udslice_sorted_move)
-    return _tables["udslice_sorted"]
+    return _get("udslice_sorted")
+
+
+def load_all():
+    """All move tables, in _BUILDERS order (twist, flip, udslice, cperm,
+    ud_edges, udslice_sorted)."""
+    return tuple(_get(key) for key in _BUILDERS)
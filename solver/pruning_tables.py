@@ -8,182 +8,238 @@ Phase 1 pruning tables:
 - flip_udslice_prune:  flip x udslice -> depth  (2048 * 495 = 1,013,760 entries)
 - twist_udslice_prune: twist x udslice -> depth  (2187 * 495 = 1,082,565 entries)
 
+The phase 1 tables only store depth mod 3, packed 4 entries per byte. Since a
+single move changes the depth by at most 1, the search recovers exact depths
+by tracking them along the path (see search.py).
+
 Phase 2 pruning tables:
 - cperm_udslice_sorted_prune:    cperm x udslice_sorted -> depth  (40320 * 24 = 967,680)
 - ud_edges_udslice_sorted_prune: ud_edges x udslice_sorted -> depth (40320 * 24 = 967,680)
+
+Phase 2 depths never exceed 15, so those tables store them as 4-bit nibbles,
+2 entries per byte.
 """
 
 import os
-import pickle
-from collections import deque
+from array import array
+from operator import add
 
-from . import coord
+from . import coord, move_tables
 from .move_tables import (
     get_twist_move, get_flip_move, get_udslice_move,
     get_cperm_move, get_ud_edges_move, get_udslice_sorted_move,
 )
-from .cube_model import PHASE2_MOVES
+from .tables import is_cached, load_or_build
 
-CACHE_DIR = os.path.join(os.path.dirname(__file__), "tables_cache")
 
+# ===========================================================================
+# 2-bit (depth mod 3) packing
+# ===========================================================================
 
-def _cache_path(name):
-    os.makedirs(CACHE_DIR, exist_ok=True)
-    return os.path.join(CACHE_DIR, f"{name}.pkl")
+def _pack_mod3(depths):
+    """Pack BFS depths as depth mod 3, 2 bits per entry, 4 entries per byte."""
+    packed = bytearray((len(depths) + 3) // 4)
+    for idx, d in enumerate(depths):
+        packed[idx >> 2] |= (d % 3) << ((idx & 3) << 1)
+    return packed
 
 
-def _load_or_generate(name, generator):
-    path = _cache_path(name)
-    if os.path.exists(path):
-        with open(path, "rb") as f:
-            return pickle.load(f)
-    table = generator()
-    with open(path, "wb") as f:
-        pickle.dump(table, f, protocol=pickle.HIGHEST_PROTOCOL)
-    return table
+def mod3_entry(table, idx):
+    """Read entry idx (depth mod 3) of a 2-bit packed pruning table."""
+    return (table[idx >> 2] >> ((idx & 3) << 1)) & 3
 
 
 # ===========================================================================
-# Phase 1 pruning tables
+# 4-bit (nibble) packing
 # ===========================================================================
 
-def _gen_flip_udslice_prune():
-    """BFS over (flip, udslice) to compute minimum moves to reach (0, 0)."""
-    n_flip = coord.N_FLIP
-    n_udslice = coord.N_UDSLICE
-    total = n_flip * n_udslice
-    table = bytearray(b'\xff' * total)  # 0xFF = unvisited
+def _pack_nibbles(depths):
+    """Pack BFS depths (all < 16) as 4-bit nibbles, 2 entries per byte.
 
-    flip_move = get_flip_move()
-    udslice_move = get_udslice_move()
+    Entry 2k goes in the low nibble of byte k and entry 2k+1 in the high one.
+    Both halves are combined with one shift and OR on big integers: no byte
+    exceeds 15, so shifting by 4 never carries into the next byte.
+    """
+    if len(depths) & 1:
+        depths = depths + b'\x00'
+    low = int.from_bytes(depths[0::2], 'little')
+    high = int.from_bytes(depths[1::2], 'little')
+    return (low | (high << 4)).to_bytes(len(depths) >> 1, 'little')
 
-    # Start from solved: flip=0, udslice=0
-    table[0] = 0
-    queue = deque()
-    queue.append((0, 0, 0))  # (flip, udslice, depth)
 
-    while queue:
-        flip, udslice, depth = queue.popleft()
-        for m in range(18):
-            new_flip = flip_move[flip][m]
-            new_udslice = udslice_move[udslice][m]
-            idx = new_flip * n_udslice + new_udslice
-            if table[idx] == 0xFF:
-                table[idx] = depth + 1
-                queue.append((new_flip, new_udslice, depth + 1))
-    return bytes(table)
+def nibble_entry(table, idx):
+    """Read entry idx (depth) of a 4-bit packed pruning table."""
+    return (table[idx >> 1] >> ((idx & 1) << 2)) & 0xF
 
 
-def _gen_twist_udslice_prune():
-    """BFS over (twist, udslice) to compute minimum moves to reach (0, 0)."""
-    n_twist = coord.N_TWIST
-    n_udslice = coord.N_UDSLICE
-    total = n_twist * n_udslice
-    table = bytearray(b'\xff' * total)
+# ===========================================================================
+# Breadth-first search
+# ===========================================================================
 
-    twist_move = get_twist_move()
-    udslice_move = get_udslice_move()
+def _bfs_depths(a_move, b_move, n_a, n_b):
+    """BFS over the combined coordinate a * n_b + b, starting from (0, 0).
+
+    a_move / b_move are flat move tables sharing the same move set. Returns a
+    bytearray of n_a * n_b depths (minimum moves to reach (0, 0)).
+
+    The search is level-synchronous. While the frontier is smaller than the
+    set of unvisited states, each layer is expanded forward from the frontier.
+    Past that point it is cheaper to scan the unvisited states and look for a
+    neighbour in the previous layer, which is valid because every move set
+    used here is closed under inverses.
+    """
+    total = n_a * n_b
+    table = bytearray(b'\xff') * total  # 0xFF = unvisited; one allocation + fill
+    n_moves = len(a_move) // n_a
+    # Split the tables into per-coordinate rows, pre-scaling the a rows so a
+    # neighbour index is a single add
+    a_scaled = [[a * n_b for a in a_move[i:i + n_moves]]
+                for i in range(0, len(a_move), n_moves)]
+    b_move = [b_move[i:i + n_moves].tolist()
+              for i in range(0, len(b_move), n_moves)]
 
     table[0] = 0
-    queue = deque()
-    queue.append((0, 0, 0))
-
-    while queue:
-        twist, udslice, depth = queue.popleft()
-        for m in range(18):
-            new_twist = twist_move[twist][m]
-            new_udslice = udslice_move[udslice][m]
-            idx = new_twist * n_udslice + new_udslice
-            if table[idx] == 0xFF:
-                table[idx] = depth + 1
-                queue.append((new_twist, new_udslice, depth + 1))
-    return bytes(table)
+    # Frontiers hold packed combined indices in a compact uint32 array;
+    # the depth is implicit in the level
+    frontier = array('I', [0])
+    unvisited = total - 1
+    depth = 0
+    while frontier:
+        depth += 1
+        next_frontier = array('I')
+        if len(frontier) < unvisited:
+            for idx in frontier:
+                a, b = divmod(idx, n_b)
+                for new_idx in map(add, a_scaled[a], b_move[b]):
+                    if table[new_idx] == 0xFF:
+                        table[new_idx] = depth
+                        next_frontier.append(new_idx)
+        else:
+            prev = depth - 1
+            idx = table.find(0xFF)
+            while idx != -1:
+                a, b = divmod(idx, n_b)
+                for new_idx in map(add, a_scaled[a], b_move[b]):
+                    if table[new_idx] == prev:
+                        table[idx] = depth
+                        next_frontier.append(idx)
+                        break
+                idx = table.find(0xFF, idx + 1)
+        unvisited -= len(next_frontier)
+        frontier = next_frontier
+    return table
 
 
 # ===========================================================================
-# Phase 2 pruning tables
+# Phase 1 pruning tables
 # ===========================================================================
 
-def _gen_cperm_udslice_sorted_prune():
-    """BFS over (cperm, udslice_sorted) with phase 2 moves."""
-    n_cperm = coord.N_CPERM
-    n_uds = coord.N_UDSLICE_SORTED
-    total = n_cperm * n_uds
-    table = bytearray(b'\xff' * total)
-
-    cperm_move = get_cperm_move()
-    uds_move = get_udslice_sorted_move()
-    n_moves = len(PHASE2_MOVES)
+def _gen_flip_udslice_prune():
+    """BFS over (flip, udslice) to compute minimum moves to reach (0, 0).
+    Returned packed as depth mod 3.
+    """
+    table = _bfs_depths(get_flip_move(), get_udslice_move(),
+                        coord.N_FLIP, coord.N_UDSLICE)
+    return _pack_mod3(table)
 
-    table[0] = 0
-    queue = deque()
-    queue.append((0, 0, 0))
 
-    while queue:
-        cperm, uds, depth = queue.popleft()
-        for mi in range(n_moves):
-            new_cperm = cperm_move[cperm][mi]
-            new_uds = uds_move[uds][mi]
-            idx = new_cperm * n_uds + new_uds
-            if table[idx] == 0xFF:
-                table[idx] = depth + 1
-                queue.append((new_cperm, new_uds, depth + 1))
-    return bytes(table)
+def _gen_twist_udslice_prune():
+    """BFS over (twist, udslice) to compute minimum moves to reach (0, 0).
+    Returned packed as depth mod 3.
+    """
+    table = _bfs_depths(get_twist_move(), get_udslice_move(),
+                        coord.N_TWIST, coord.N_UDSLICE)
+    return _pack_mod3(table)
 
 
-def _gen_ud_edges_udslice_sorted_prune():
-    """BFS over (ud_edges_perm, udslice_sorted) with phase 2 moves."""
-    n_ud = coord.N_UD_EDGES
-    n_uds = coord.N_UDSLICE_SORTED
-    total = n_ud * n_uds
-    table = bytearray(b'\xff' * total)
+# ===========================================================================
+# Phase 2 pruning tables
+# ===========================================================================
 
-    ud_move = get_ud_edges_move()
-    uds_move = get_udslice_sorted_move()
-    n_moves = len(PHASE2_MOVES)
+def _gen_cperm_udslice_sorted_prune():
+    """BFS over (cperm, udslice_sorted) with phase 2 moves.
+    Returned packed as nibbles.
+    """
+    table = _bfs_depths(get_cperm_move(), get_udslice_sorted_move(),
+                        coord.N_CPERM, coord.N_UDSLICE_SORTED)
+    return _pack_nibbles(table)
 
-    table[0] = 0
-    queue = deque()
-    queue.append((0, 0, 0))
 
-    while queue:
-        ud, uds, depth = queue.popleft()
-        for mi in range(n_moves):
-            new_ud = ud_move[ud][mi]
-            new_uds = uds_move[uds][mi]
-            idx = new_ud * n_uds + new_uds
-            if table[idx] == 0xFF:
-                table[idx] = depth + 1
-                queue.append((new_ud, new_uds, depth + 1))
-    return bytes(table)
+def _gen_ud_edges_udslice_sorted_prune():
+    """BFS over (ud_edges_perm, udslice_sorted) with phase 2 moves.
+    Returned packed as nibbles.
+    """
+    table = _bfs_depths(get_ud_edges_move(), get_udslice_sorted_move(),
+                        coord.N_UD_EDGES, coord.N_UDSLICE_SORTED)
+    return _pack_nibbles(table)
 
 
 # ===========================================================================
 # Public API: lazy-loaded tables
 # ===========================================================================
 
+# Cache name and builder of each table, keyed like _tables
+_BUILDERS = {
+    "flip_udslice": ("flip_udslice_prune_mod3", _gen_flip_udslice_prune),
+    "twist_udslice": ("twist_udslice_prune_mod3", _gen_twist_udslice_prune),
+    "cperm_uds": ("cperm_udslice_sorted_prune_nib", _gen_cperm_udslice_sorted_prune),
+    "ud_edges_uds": ("ud_edges_udslice_sorted_prune_nib",
+                     _gen_ud_edges_udslice_sorted_prune),
+}
+
 _tables = {}
 
+def _get(key):
+    if key not in _tables:
+        _tables[key] = load_or_build(*_BUILDERS[key])
+    return _tables[key]
+
 def get_flip_udslice_prune():
-    if "flip_udslice" not in _tables:
-        _tables["flip_udslice"] = _load_or_generate(
-            "flip_udslice_prune", _gen_flip_udslice_prune)
-    return _tables["flip_udslice"]
+    return _get("flip_udslice")
 
 def get_twist_udslice_prune():
-    if "twist_udslice" not in _tables:
-        _tables["twist_udslice"] = _load_or_generate(
-            "twist_udslice_prune", _gen_twist_udslice_prune)
-    return _tables["twist_udslice"]
+    return _get("twist_udslice")
 
 def get_cperm_udslice_sorted_prune():
-    if "cperm_uds" not in _tables:
-        _tables["cperm_uds"] = _load_or_generate(
-            "cperm_udslice_sorted_prune", _gen_cperm_udslice_sorted_prune)
-    return _tables["cperm_uds"]
+    return _get("cperm_uds")
 
 def get_ud_edges_udslice_sorted_prune():
-    if "ud_edges_uds" not in _tables:
-        _tables["ud_edges_uds"] = _load_or_generate(
-            "ud_edges_udslice_sorted_prune", _gen_ud_edges_udslice_sorted_prune)
-    return _tables["ud_edges_uds"]
+    return _get("ud_edges_uds")
+
+
+def load_all():
+    """All pruning tables, in _BUILDERS order (flip_udslice, twist_udslice,
+    cperm_uds, ud_edges_uds)."""
+    return tuple(_get(key) for key in _BUILDERS)
+
+
+def _build_cached(name, builder):
+    # Worker side of warm_all(): the table goes to the cache, not back
+    # through the pipe
+    load_or_build(name, builder)
+
+
+def warm_all():
+    """Build the missing pruning tables in parallel, one process per table.
+
+    Each table is an independent single-threaded BFS, so on a cold cache
+    the wait drops from the sum of the build times to the longest one.
+    The move tables are loaded first so the workers share them instead of
+    each rebuilding them. Tables are then loaded lazily from the cache as
+    usual. Does nothing useful on a single core, where the getters simply
+    build the tables in turn.
+    """
+    missing = [(name, builder) for name, builder in _BUILDERS.values()
+               if not is_cached(name)]
+    workers = min(len(missing), os.cpu_count() or 1)
+    if workers < 2:
+        return
+    # Imported here: it pulls in multiprocessing and logging (~25 ms), which
+    # only a cold cache needs
+    from concurrent.futures import ProcessPoolExecutor
+    move_tables.load_all()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_build_cached, name, builder)
+                   for name, builder in missing]
+        for future in futures:
+            future.result()
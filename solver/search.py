@@ -9,24 +9,27 @@ Phase 2: From the G1 state, search using only G1-preserving moves (U,U2,U',D,D2,
 The search iterates over increasing total solution lengths to find short solutions.
 """
 
-from . import coord
+import time
+
+from . import coord, move_tables, pruning_tables
 from .cube_model import CubieCube, MOVE_CUBES, MOVE_NAMES, PHASE2_MOVES
-from .move_tables import (
-    get_twist_move, get_flip_move, get_udslice_move,
-    get_cperm_move, get_ud_edges_move, get_udslice_sorted_move,
-)
-from .pruning_tables import (
-    get_flip_udslice_prune, get_twist_udslice_prune,
-    get_cperm_udslice_sorted_prune, get_ud_edges_udslice_sorted_prune,
-)
+from .pruning_tables import mod3_entry
+
+
+# Search nodes visited between two checks of the clock
+_TIME_CHECK_INTERVAL = 4096
 
+# _CHILD_DEPTH[d][v] = exact depth of a neighbour of a depth-d state whose
+# phase 1 pruning entry (depth mod 3) is v: one of d-1, d, d+1
+_CHILD_DEPTH = tuple(
+    tuple(d + (v - d + 1) % 3 - 1 for v in range(3)) for d in range(32))
 
 # Which face axis each move belongs to (for move filtering)
 # U=0,U2=0,U'=0, R=1,R2=1,R'=1, F=2,F2=2,F'=2, D=3,D2=3,D'=3, L=4,L2=4,L'=4, B=5,B2=5,B'=5
 _MOVE_AXIS = [i // 3 for i in range(18)]
 
-# Opposite faces: U-D, R-L, F-B
-_OPPOSITE = {0: 3, 3: 0, 1: 4, 4: 1, 2: 5, 5: 2}
+# Opposite faces: U-D, R-L, F-B (_OPPOSITE[axis] = opposite axis)
+_OPPOSITE = (3, 4, 5, 0, 1, 2)
 
 
 def _moves_compatible(last_move, move):
@@ -42,36 +45,94 @@ def _moves_compatible(last_move, move):
     this_axis = _MOVE_AXIS[move]
     if last_axis == this_axis:
         return False
-    if _OPPOSITE.get(last_axis) == this_axis and last_axis > this_axis:
+    if _OPPOSITE[last_axis] == this_axis and last_axis > this_axis:
         return False
     return True
 
 
+# _NEXT_MOVES[last_move] = moves allowed after last_move, and
+# _NEXT_PHASE2_MOVES[last_move] = indices into PHASE2_MOVES of the phase 2
+# moves allowed after it, so the searches never call _moves_compatible().
+# last_move == -1 (no previous move) selects the final entry.
+_NEXT_MOVES = tuple(
+    tuple(m for m in range(18) if _moves_compatible(last, m))
+    for last in (*range(18), -1))
+_NEXT_PHASE2_MOVES = tuple(
+    tuple(mi for mi, m in enumerate(PHASE2_MOVES) if _moves_compatible(last, m))
+    for last in (*range(18), -1))
+# The same, indexed by the previous move's index into PHASE2_MOVES
+_NEXT_PHASE2_AFTER_PHASE2 = tuple(_NEXT_PHASE2_MOVES[m] for m in PHASE2_MOVES)
+# _LAST_PHASE1_MOVES[last_move] = the moves in _NEXT_MOVES[last_move] that may
+# end phase 1: quarter turns of R, F, L and B. A phase 1 solution ending with
+# a phase 2 move was already in G1 one move earlier, so it is covered by the
+# shorter phase 1 depth, whose phase 2 search can play that move itself.
+_LAST_PHASE1_MOVES = tuple(
+    tuple(m for m in moves if m not in PHASE2_MOVES) for moves in _NEXT_MOVES)
+
+
 class TwoPhaseSearch:
-    """Kociemba two-phase IDA* solver."""
+    """Kociemba two-phase IDA* solver.
+
+    The search runs on a single thread. It is pure Python and holds the GIL,
+    so threads would not speed it up, and a typical solve (~0.1 s) is shorter
+    than starting worker processes to split the tree by first move.
+    """
 
     def __init__(self):
         # Load all tables
-        self.twist_move = get_twist_move()
-        self.flip_move = get_flip_move()
-        self.udslice_move = get_udslice_move()
-        self.cperm_move = get_cperm_move()
-        self.ud_edges_move = get_ud_edges_move()
-        self.udslice_sorted_move = get_udslice_sorted_move()
-
-        self.flip_udslice_prune = get_flip_udslice_prune()
-        self.twist_udslice_prune = get_twist_udslice_prune()
-        self.cperm_uds_prune = get_cperm_udslice_sorted_prune()
-        self.ud_edges_uds_prune = get_ud_edges_udslice_sorted_prune()
+        (self.twist_move, self.flip_move, self.udslice_move,
+         self.cperm_move, self.ud_edges_move,
+         self.udslice_sorted_move) = move_tables.load_all()
+        (self.flip_udslice_prune, self.twist_udslice_prune,
+         self.cperm_uds_prune, self.ud_edges_uds_prune) = pruning_tables.load_all()
+        # The tables each search reads per node, fetched with one attribute
+        # load and unpacked into locals
+        self._phase1_tables = (self.twist_move, self.flip_move, self.udslice_move,
+                               self.flip_udslice_prune, self.twist_udslice_prune)
+        self._phase2_tables = (self.cperm_move, self.ud_edges_move,
+                               self.udslice_sorted_move,
+                               self.cperm_uds_prune, self.ud_edges_uds_prune)
 
     def solve(self, cube, max_length=23, timeout_seconds=30):
         """Find a solution for the given CubieCube.
 
-        Returns a list of move names (e.g., ["R", "U'", "F2", ...]).
-        Tries to find progressively shorter solutions.
+        Returns a (moves, phase1_length) tuple, moves being a list of move
+        names (e.g., ["R", "U'", "F2", ...]), or None if no solution was
+        found. This is the first solution _solutions() finds.
+        """
+        return next(self._solutions(cube, max_length, timeout_seconds), None)
+
+    def solve_iter(self, cube, max_length=23, timeout_seconds=30,
+                   improve_seconds=1.0):
+        """Yield successively shorter solutions for the given CubieCube.
+
+        Each item is a (moves, phase1_length) tuple as returned by solve().
+        Once a solution is found, the search carries on for at most
+        improve_seconds more (and never past timeout_seconds overall).
+        """
+        improve_ns = int(improve_seconds * 1e9)
+        for result in self._solutions(cube, max_length, timeout_seconds):
+            yield result
+            self._deadline_ns = min(self._deadline_ns,
+                                    time.monotonic_ns() + improve_ns)
+
+    def _solutions(self, cube, max_length, timeout_seconds):
+        """Yield successively shorter solutions for the given CubieCube.
+
+        Phase 1 solutions are enumerated rather than abandoned at the first
+        one that leads to a solution: after each solution the total length
+        bound drops to one less than its length, and the enumeration resumes
+        where it stopped, phase 2 only looking for what would beat it. The
+        phase 1 nodes already visited could not reach a solution under the
+        looser bound, so nothing is missed and nothing is searched twice.
+        Stops once the bound cannot be met or the deadline (read again after
+        each solution, see solve_iter()) has passed.
         """
-        import time
-        start_time = time.time()
+        # Deadline on the monotonic clock, in integer nanoseconds: immune to
+        # wall-clock changes and compared without float allocations. Set
+        # before any yield, since solve_iter() lowers it after each one.
+        self._deadline_ns = time.monotonic_ns() + int(timeout_seconds * 1e9)
+        self._timed_out = False
 
         # Validate
         err = cube.validate()
@@ -79,110 +140,196 @@ class TwoPhaseSearch:
             raise ValueError(f"Invalid cube state: {err}")
 
         if cube.is_solved():
-            return ([], 0)
+            yield ([], 0)
+            return
 
         # Extract phase 1 coordinates
         twist = coord.get_twist(cube)
         flip = coord.get_flip(cube)
         udslice = coord.get_udslice(cube)
 
-        # We need the full cubie state to extract phase 2 coords after phase 1
-        # Store the cube for phase 2 initialization
-        self._cube = cube
+        # The phase 1 tables only hold depth mod 3: find the exact start depths
+        dflip = self._phase1_depth(flip, udslice, self.flip_move,
+                                   self.flip_udslice_prune)
+        dtwist = self._phase1_depth(twist, udslice, self.twist_move,
+                                    self.twist_udslice_prune)
+
+        # We need the full cubie state to extract phase 2 coords after phase 1.
+        # _cubies[i] is the cube after the first i moves of _cubie_moves, the
+        # phase 1 moves of the last _start_phase2() call; _cubie_moves[i] is
+        # -1 past the last valid entry.
+        self._cubies = [cube] + [None] * max_length
+        self._cubie_moves = [-1] * (max_length + 1)
         self._best_solution = None
         self._phase1_length = 0
-        self._timeout = start_time + timeout_seconds
-
-        # Try increasing phase 1 depths
-        for phase1_depth in range(max_length + 1):
-            if time.time() > self._timeout:
-                break
-
-            # phase1_moves stores the move indices found so far
-            phase1_moves = [-1] * phase1_depth
-
-            # Coordinate stacks for phase 1
-            twist_stack = [0] * (phase1_depth + 1)
-            flip_stack = [0] * (phase1_depth + 1)
-            udslice_stack = [0] * (phase1_depth + 1)
-            twist_stack[0] = twist
-            flip_stack[0] = flip
-            udslice_stack[0] = udslice
-
-            if self._phase1_search(
-                phase1_moves, 0, phase1_depth,
-                twist_stack, flip_stack, udslice_stack,
-                max_length
+        # Longest total length still worth finding
+        self._max_length = max_length
+        self._time_budget = _TIME_CHECK_INTERVAL
+
+        # Move buffers, allocated once per solve and reused by every depth
+        # iteration: an entry is always written before it is read, so stale
+        # values past the current depth are harmless. The coordinates of each
+        # depth live in the searches' own stack frames.
+        n = max_length + 1
+        # phase1_moves stores the move indices found so far
+        phase1_moves = [-1] * n
+        # Phase 2 equivalent, shared by every _start_phase2() call
+        self._phase2_moves = [-1] * n  # indices into PHASE2_MOVES
+
+        # Try increasing phase 1 depths, starting from the root's lower bound
+        phase1_depth = max(dflip, dtwist)
+        while phase1_depth <= self._max_length:
+            if time.monotonic_ns() > self._deadline_ns:
+                return
+
+            for solution in self._phase1_search(
+                phase1_moves, phase1_depth,
+                twist, flip, udslice, dflip, dtwist
             ):
-                # Found a solution within max_length
-                break
-
-            if self._best_solution is not None:
-                break
-
-        if self._best_solution is not None:
-            return ([MOVE_NAMES[m] for m in self._best_solution], self._phase1_length)
+                yield ([MOVE_NAMES[m] for m in solution], self._phase1_length)
 
-        return None  # No solution found
+            if self._timed_out:
+                return
+            phase1_depth += 1
 
-    def _phase1_prune(self, twist, flip, udslice):
-        """Phase 1 pruning: lower bound on moves to reach G1."""
-        idx1 = flip * coord.N_UDSLICE + udslice
-        idx2 = twist * coord.N_UDSLICE + udslice
-        d1 = self.flip_udslice_prune[idx1]
-        d2 = self.twist_udslice_prune[idx2]
-        return max(d1, d2)
+    def _phase1_depth(self, c, udslice, c_move, prune):
+        """Exact depth of (c, udslice) in a mod-3 packed phase 1 pruning table.
 
-    def _phase1_search(self, moves, depth, max_depth,
-                       twist_s, flip_s, udslice_s, total_max):
-        """Recursive IDA* for phase 1.
-
-        Returns True if we should stop searching (solution found or timeout).
+        Each neighbour is at depth d-1, d or d+1, which have distinct values
+        mod 3, so we can walk to the goal by always taking a move whose entry
+        is one less (mod 3) and count the steps.
         """
-        import time
-
-        twist = twist_s[depth]
-        flip = flip_s[depth]
-        udslice = udslice_s[depth]
-
-        if depth == max_depth:
-            # Check if we reached G1
-            if twist == 0 and flip == 0 and udslice == 0:
-                # Phase 1 solved! Now try phase 2.
-                return self._start_phase2(moves[:depth], total_max - depth)
-            return False
-
-        # Pruning
-        remaining = max_depth - depth
-        if self._phase1_prune(twist, flip, udslice) > remaining:
-            return False
-
-        last_move = moves[depth - 1] if depth > 0 else -1
-        for m in range(18):
-            if not _moves_compatible(last_move, m):
-                continue
-
-            if time.time() > self._timeout:
-                return True
-
-            moves[depth] = m
-            twist_s[depth + 1] = self.twist_move[twist][m]
-            flip_s[depth + 1] = self.flip_move[flip][m]
-            udslice_s[depth + 1] = self.udslice_move[udslice][m]
-
-            if self._phase1_search(moves, depth + 1, max_depth,
-                                   twist_s, flip_s, udslice_s, total_max):
-                return True
-        return False
+        n_uds = coord.N_UDSLICE
+        depth = 0
+        while c != 0 or udslice != 0:
+            closer = (mod3_entry(prune, c * n_uds + udslice) - 1) % 3
+            for m in range(18):
+                nc = c_move[c * 18 + m]
+                nu = self.udslice_move[udslice * 18 + m]
+                if mod3_entry(prune, nc * n_uds + nu) == closer:
+                    c, udslice = nc, nu
+                    break
+            depth += 1
+        return depth
+
+    def _phase1_search(self, moves, max_depth,
+                       twist, flip, udslice, dflip, dtwist):
+        """Iterative IDA* for phase 1, from the node (twist, flip, udslice)
+        to depth max_depth.
+
+        dflip / dtwist are the exact pruning depths of (flip, udslice) and
+        (twist, udslice). Runs on an explicit stack like _phase2_search(),
+        and children that cannot reach G1 within the remaining moves are
+        pruned before they are pushed.
+
+        Generator: yields each full solution (move indices) strictly shorter
+        than the previous one, lowering self._max_length after each, and
+        returns at the end of the depth or on timeout.
+        """
+        if max_depth == 0:
+            # The root's bound is 0: it already is in G1
+            if (self._start_phase2([], self._max_length)
+                    and not self._timed_out):
+                # Later phase 1 depths must beat this solution too
+                self._max_length = len(self._best_solution) - 1
+                yield self._best_solution
+            return
+
+        (twist_move, flip_move, udslice_move,
+         flip_uds_prune, twist_uds_prune) = self._phase1_tables
+        # frames[depth] = (moves still to try, row offsets into the flat,
+        # row-major move tables, exact child depths by pruning value mod 3)
+        frames = [None] * max_depth
+        last = max_depth - 1
+        # move_sets[depth] = allowed moves at depth, by previous move
+        move_sets = [_NEXT_MOVES] * last + [_LAST_PHASE1_MOVES]
+        frames[0] = (iter(move_sets[0][-1]), twist * 18, flip * 18, udslice * 18,
+                     _CHILD_DEPTH[dflip], _CHILD_DEPTH[dtwist])
+        depth = 0
+        while depth >= 0:
+            (moves_left, twist_row, flip_row, udslice_row,
+             dflip_child, dtwist_child) = frames[depth]
+            remaining = max_depth - depth
+            for m in moves_left:
+                # Pruning: a child needs at least its depth in moves to reach
+                # G1, and it has remaining - 1 left
+                new_udslice = udslice_move[udslice_row + m]
+                new_flip = flip_move[flip_row + m]
+                idx = new_flip * 495 + new_udslice  # N_UDSLICE = 495
+                new_dflip = dflip_child[
+                    (flip_uds_prune[idx >> 2] >> ((idx & 3) << 1)) & 3]
+                if new_dflip >= remaining:
+                    continue
+                new_twist = twist_move[twist_row + m]
+                idx = new_twist * 495 + new_udslice
+                new_dtwist = dtwist_child[
+                    (twist_uds_prune[idx >> 2] >> ((idx & 3) << 1)) & 3]
+                if new_dtwist >= remaining:
+                    continue
+
+                moves[depth] = m
+                if depth == last:
+                    # Both depths are 0 only in G1: phase 1 solved! Now try
+                    # phase 2.
+                    if self._start_phase2(moves[:max_depth],
+                                          self._max_length - max_depth):
+                        if self._timed_out:
+                            return
+                        # Keep enumerating for strictly shorter solutions
+                        self._max_length = len(self._best_solution) - 1
+                        yield self._best_solution
+                        if max_depth > self._max_length:
+                            return
+                    continue
+
+                # The clock is only read every _TIME_CHECK_INTERVAL nodes
+                self._time_budget -= 1
+                if not self._time_budget:
+                    self._time_budget = _TIME_CHECK_INTERVAL
+                    if time.monotonic_ns() > self._deadline_ns:
+                        self._timed_out = True
+                        return
+
+                depth += 1
+                frames[depth] = (iter(move_sets[depth][m]),
+                                 new_twist * 18, new_flip * 18, new_udslice * 18,
+                                 _CHILD_DEPTH[new_dflip], _CHILD_DEPTH[new_dtwist])
+                break
+            else:
+                depth -= 1
 
     def _start_phase2(self, phase1_moves, max_phase2_depth):
-        """Initialize and run phase 2 search after phase 1 solution found."""
-        import time
+        """Initialize and run phase 2 search after phase 1 solution found.
 
-        # Apply phase 1 moves to get the G1 state
-        cube2 = self._cube.copy()
-        for m in phase1_moves:
+        Returns True once a solution of at most max_phase2_depth phase 2
+        moves is stored in self._best_solution, or on timeout (which also
+        sets self._timed_out).
+        """
+
+        # Apply phase 1 moves to get the G1 state. Successive phase 1
+        # solutions come out of a depth-first search and share most of their
+        # moves, so only the moves after the prefix shared with the previous
+        # call are applied, from the cube cached at that depth. apply_move()
+        # rebinds fresh arrays instead of writing into them, so each new cube
+        # can start out sharing its parent's arrays rather than copying them
+        # (as in multiply()).
+        cubies = self._cubies
+        cubie_moves = self._cubie_moves
+        n = len(phase1_moves)
+        i = 0
+        while i < n and cubie_moves[i] == phase1_moves[i]:
+            i += 1
+        while i < n:
+            cube = cubies[i]
+            m = phase1_moves[i]
+            cube2 = CubieCube.__new__(CubieCube)
+            cube2.cp, cube2.co, cube2.ep, cube2.eo = cube.cp, cube.co, cube.ep, cube.eo
             cube2.apply_move(MOVE_CUBES[m])
+            cubie_moves[i] = m
+            i += 1
+            cubies[i] = cube2
+        cubie_moves[n] = -1
+        cube2 = cubies[n]
 
         # Extract phase 2 coordinates
         cperm = coord.get_cperm(cube2)
@@ -195,86 +342,87 @@ class TwoPhaseSearch:
             self._phase1_length = len(phase1_moves)
             return True
 
-        n_phase2_moves = len(PHASE2_MOVES)
+        phase2_moves = self._phase2_moves
 
-        # Try increasing phase 2 depths
-        for phase2_depth in range(1, max_phase2_depth + 1):
-            if time.time() > self._timeout:
+        # Try increasing phase 2 depths, starting from the root's lower bound
+        n_uds = coord.N_UDSLICE_SORTED
+        idx1 = cperm * n_uds + udslice_sorted
+        idx2 = ud_edges * n_uds + udslice_sorted
+        bound = max((self.cperm_uds_prune[idx1 >> 1] >> ((idx1 & 1) << 2)) & 0xF,
+                    (self.ud_edges_uds_prune[idx2 >> 1] >> ((idx2 & 1) << 2)) & 0xF)
+        for phase2_depth in range(bound, max_phase2_depth + 1):
+            if time.monotonic_ns() > self._deadline_ns:
+                self._timed_out = True
                 return True
 
-            phase2_moves = [-1] * phase2_depth  # indices into PHASE2_MOVES
-
-            cperm_s = [0] * (phase2_depth + 1)
-            ud_edges_s = [0] * (phase2_depth + 1)
-            uds_s = [0] * (phase2_depth + 1)
-            cperm_s[0] = cperm
-            ud_edges_s[0] = ud_edges
-            uds_s[0] = udslice_sorted
-
             if self._phase2_search(
-                phase2_moves, 0, phase2_depth,
-                cperm_s, ud_edges_s, uds_s,
+                phase2_moves, phase2_depth,
+                cperm, ud_edges, udslice_sorted,
                 phase1_moves
             ):
                 return True
         return False
 
-    def _phase2_prune(self, cperm, ud_edges, udslice_sorted):
-        """Phase 2 pruning: lower bound on moves to solve within G1."""
-        n_uds = coord.N_UDSLICE_SORTED
-        idx1 = cperm * n_uds + udslice_sorted
-        idx2 = ud_edges * n_uds + udslice_sorted
-        d1 = self.cperm_uds_prune[idx1]
-        d2 = self.ud_edges_uds_prune[idx2]
-        return max(d1, d2)
-
-    def _phase2_search(self, moves, depth, max_depth,
-                       cperm_s, ud_edges_s, uds_s,
-                       phase1_moves):
-        """Recursive IDA* for phase 2."""
-        import time
-
-        cperm = cperm_s[depth]
-        ud_edges = ud_edges_s[depth]
-        uds = uds_s[depth]
-
-        if depth == max_depth:
-            if cperm == 0 and ud_edges == 0 and uds == 0:
-                # Solved!
-                full_solution = list(phase1_moves)
-                for i in range(depth):
-                    full_solution.append(PHASE2_MOVES[moves[i]])
-                self._best_solution = full_solution
-                self._phase1_length = len(phase1_moves)
-                return True
-            return False
-
-        remaining = max_depth - depth
-        if self._phase2_prune(cperm, ud_edges, uds) > remaining:
-            return False
+    def _phase2_search(self, moves, max_depth,
+                       cperm, ud_edges, uds, phase1_moves):
+        """Iterative IDA* for phase 2, from the node (cperm, ud_edges, uds)
+        to depth max_depth.
 
-        # Determine last move for filtering
-        if depth > 0:
-            last_real_move = PHASE2_MOVES[moves[depth - 1]]
-        elif phase1_moves:
-            last_real_move = phase1_moves[-1]
+        Runs on an explicit stack instead of recursing: frames[depth] holds
+        the iterator over the moves still to try at that depth and the row
+        offsets of its coordinates, so descending and backtracking are plain
+        index updates. As in phase 1, children are pruned before they are
+        pushed.
+        """
+        (cperm_move, ud_edges_move, udslice_sorted_move,
+         cperm_uds_prune, ud_edges_uds_prune) = self._phase2_tables
+        if phase1_moves:
+            next_moves = _NEXT_PHASE2_MOVES[phase1_moves[-1]]
         else:
-            last_real_move = -1
-
-        for mi, m in enumerate(PHASE2_MOVES):
-            if not _moves_compatible(last_real_move, m):
-                continue
-
-            if time.time() > self._timeout:
-                return True
-
-            moves[depth] = mi
-            cperm_s[depth + 1] = self.cperm_move[cperm][mi]
-            ud_edges_s[depth + 1] = self.ud_edges_move[ud_edges][mi]
-            uds_s[depth + 1] = self.udslice_sorted_move[uds][mi]
-
-            if self._phase2_search(moves, depth + 1, max_depth,
-                                   cperm_s, ud_edges_s, uds_s,
-                                   phase1_moves):
-                return True
+            next_moves = _NEXT_PHASE2_MOVES[-1]
+
+        frames = [None] * max_depth
+        frames[0] = (iter(next_moves), cperm * 10, ud_edges * 10, uds * 10)
+        last = max_depth - 1
+        depth = 0
+        while depth >= 0:
+            moves_left, cperm_row, ud_edges_row, uds_row = frames[depth]
+            remaining = max_depth - depth
+            for mi in moves_left:
+                # Pruning: lower bound on moves to solve within G1, read inline
+                # from the nibble-packed tables (2 entries per byte)
+                new_uds = udslice_sorted_move[uds_row + mi]
+                new_cperm = cperm_move[cperm_row + mi]
+                idx = new_cperm * 24 + new_uds  # N_UDSLICE_SORTED = 24
+                if (cperm_uds_prune[idx >> 1] >> ((idx & 1) << 2)) & 0xF >= remaining:
+                    continue
+                new_ud_edges = ud_edges_move[ud_edges_row + mi]
+                idx = new_ud_edges * 24 + new_uds
+                if (ud_edges_uds_prune[idx >> 1] >> ((idx & 1) << 2)) & 0xF >= remaining:
+                    continue
+
+                moves[depth] = mi
+                if depth == last:
+                    # Both bounds are 0 only at the goal: solved!
+                    full_solution = list(phase1_moves)
+                    for i in range(max_depth):
+                        full_solution.append(PHASE2_MOVES[moves[i]])
+                    self._best_solution = full_solution
+                    self._phase1_length = len(phase1_moves)
+                    return True
+
+                # The clock is only read every _TIME_CHECK_INTERVAL nodes
+                self._time_budget -= 1
+                if not self._time_budget:
+                    self._time_budget = _TIME_CHECK_INTERVAL
+                    if time.monotonic_ns() > self._deadline_ns:
+                        self._timed_out = True
+                        return True
+
+                depth += 1
+                frames[depth] = (iter(_NEXT_PHASE2_AFTER_PHASE2[mi]),
+                                 new_cperm * 10, new_ud_edges * 10, new_uds * 10)
+                break
+            else:
+                depth -= 1
         return False
@@ -15,6 +15,13 @@ from .search import TwoPhaseSearch
 
 _solver = None
 
+# Move name -> index into MOVE_NAMES / MOVE_CUBES
+_MOVE_INDEX = {name: i for i, name in enumerate(MOVE_NAMES)}
+
+# _OFF_AXIS_MOVES[axis] = the 15 moves that do not turn a face on axis
+_OFF_AXIS_MOVES = tuple(tuple(m for m in range(18) if m // 3 != axis)
+                        for axis in range(6))
+
 
 def _get_solver():
     global _solver
@@ -23,6 +30,15 @@ def _get_solver():
     return _solver
 
 
+def _to_cube(cube_input):
+    if isinstance(cube_input, str):
+        cube_input = cube_input.replace(" ", "")
+        return CubieCube.from_facelet_string(cube_input)
+    if isinstance(cube_input, CubieCube):
+        return cube_input
+    raise TypeError("cube_input must be a facelet string or CubieCube")
+
+
 def solve(cube_input, max_length=23, timeout=30):
     """Solve a Rubik's Cube.
 
@@ -34,14 +50,7 @@ def solve(cube_input, max_length=23, timeout=30):
     Returns:
         A list of move strings (e.g., ["R", "U'", "F2"]) or None if no solution found.
     """
-    if isinstance(cube_input, str):
-        cube_input = cube_input.replace(" ", "")
-        cube = CubieCube.from_facelet_string(cube_input)
-    elif isinstance(cube_input, CubieCube):
-        cube = cube_input
-    else:
-        raise TypeError("cube_input must be a facelet string or CubieCube")
-
+    cube = _to_cube(cube_input)
     solver = _get_solver()
     result = solver.solve(cube, max_length=max_length, timeout_seconds=timeout)
     if result is None:
@@ -50,6 +59,27 @@ def solve(cube_input, max_length=23, timeout=30):
     return {"moves": moves, "phase1_length": phase1_length}
 
 
+def solve_iter(cube_input, max_length=23, timeout=30, improve_timeout=1.0):
+    """Yield successively shorter solutions of a Rubik's Cube.
+
+    Args:
+        cube_input: Either a 54-character facelet string (URFDLB) or a CubieCube.
+        max_length: Maximum solution length to search for.
+        timeout: Maximum total time in seconds.
+        improve_timeout: Extra time spent looking for shorter solutions
+            once the first one is found.
+
+    Yields:
+        Dicts with 'moves' and 'phase1_length', as returned by solve().
+    """
+    cube = _to_cube(cube_input)
+    solver = _get_solver()
+    for moves, phase1_length in solver.solve_iter(
+            cube, max_length=max_length, timeout_seconds=timeout,
+            improve_seconds=improve_timeout):
+        yield {"moves": moves, "phase1_length": phase1_length}
+
+
 def solve_from_moves(scramble_moves, max_length=23, timeout=30):
     """Solve a cube that has been scrambled with the given moves.
 
@@ -59,13 +89,11 @@ def solve_from_moves(scramble_moves, max_length=23, timeout=30):
     Returns:
         A list of move strings for the solution.
     """
-    move_map = {name: i for i, name in enumerate(MOVE_NAMES)}
-
     cube = CubieCube()
     for move_str in scramble_moves:
-        if move_str not in move_map:
+        if move_str not in _MOVE_INDEX:
             raise ValueError(f"Unknown move: {move_str}")
-        cube.apply_move(MOVE_CUBES[move_map[move_str]])
+        cube.apply_move(MOVE_CUBES[_MOVE_INDEX[move_str]])
 
     return solve(cube, max_length=max_length, timeout=timeout)
 
@@ -78,20 +106,23 @@ def scramble(n_moves=20):
     """
     import random
     cube = CubieCube()
-    moves = []
-    last_axis = -1
-    for _ in range(n_moves):
-        while True:
-            m = random.randint(0, 17)
-            axis = m // 3
-            if axis != last_axis:
-                break
+    if n_moves <= 0:
+        return cube, []
+    # Draw every move up front in one batch. Each move after the first is
+    # one of the 15 moves off the previous move's axis, so no draw is
+    # rejected and the distribution matches rejection sampling.
+    move_idx = [random.randrange(18)]
+    for pick in random.choices(range(15), k=n_moves - 1):
+        move_idx.append(_OFF_AXIS_MOVES[move_idx[-1] // 3][pick])
+    for m in move_idx:
         cube.apply_move(MOVE_CUBES[m])
-        moves.append(MOVE_NAMES[m])
-        last_axis = axis
-    return cube, moves
+    return cube, [MOVE_NAMES[m] for m in move_idx]
 
 
 def initialize():
-    """Pre-load all tables. Call this at startup to avoid delay on first solve."""
+    """Pre-load all tables. Call this at startup to avoid delay on first solve.
+
+    Missing tables are built serially in this process; run `python -m solver`
+    beforehand to build them in parallel.
+    """
     _get_solver()
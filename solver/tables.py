@@ -0,0 +1,58 @@
+"""
+On-disk cache for the solver's move and pruning tables.
+
+Tables are generated once and stored in solver/tables_cache/. Flat
+tables (the move tables and the pruning tables) are written as raw .bin
+files and memory-mapped read-only when loaded, so nothing is unpickled.
+Byte tables are used straight from the map: pages are read on demand and
+shared between processes through the page cache. Wider tables are read
+into an array.array, whose indexing is faster than a cast memoryview's.
+"""
+
+import mmap
+import os
+from array import array
+
+CACHE_DIR = os.path.join(os.path.dirname(__file__), "tables_cache")
+
+
+def _cache_path(name, ext):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    return os.path.join(CACHE_DIR, f"{name}.{ext}")
+
+
+def _write_atomic(path, data):
+    # Write to a temporary file first so a concurrent reader (e.g. the
+    # table-building child process started by main.py) never sees a
+    # partially written cache.
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def is_cached(name):
+    """Whether table `name` is already cached (see load_or_build)."""
+    return os.path.exists(_cache_path(name, "bin"))
+
+
+def load_or_build(name, builder, typecode="B"):
+    """Return the cached table `name`, calling builder() and caching on a miss.
+
+    The table is a flat array of `typecode` items whose buffer is stored
+    verbatim in <name>.bin. A cached byte table is returned as a read-only
+    mmap, other cached tables as an array.array; a freshly built table is
+    returned as the builder made it.
+    """
+    path = _cache_path(name, "bin")
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            if typecode == "B":
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            table = array(typecode)
+            table.frombytes(f.read())
+            return table
+    table = builder()
+    # Written straight from the table's buffer, without a bytes() copy
+    _write_atomic(path, table)
+    return table
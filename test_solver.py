@@ -85,22 +85,37 @@ flip_move = get_flip_move()
 udslice_move = get_udslice_move()
 print(f"Phase 1 move tables loaded in {time.time()-t0:.1f}s")
 
-# Verify: applying U to solved (twist=0) should still give twist=0
-assert twist_move[0][0] == 0, "U on twist=0 should give twist=0"
-assert flip_move[0][0] == 0, "U on flip=0 should give flip=0"
+# Verify: applying U (move 0) to solved (twist=0) should still give twist=0
+# (flat tables: the entry for coordinate c and move m is at c * 18 + m)
+assert twist_move[0] == 0, "U on twist=0 should give twist=0"
+assert flip_move[0] == 0, "U on flip=0 should give flip=0"
 print("OK: Move tables consistent")
 
 # Test 9: Pruning tables
 print("\n=== Test 9: Pruning tables (this may take a while on first run) ===")
 t0 = time.time()
-from solver.pruning_tables import get_flip_udslice_prune, get_twist_udslice_prune
+from solver.pruning_tables import get_flip_udslice_prune, get_twist_udslice_prune, mod3_entry
 flip_uds_prune = get_flip_udslice_prune()
 twist_uds_prune = get_twist_udslice_prune()
 print(f"Phase 1 pruning tables loaded in {time.time()-t0:.1f}s")
-assert flip_uds_prune[0] == 0, "Solved state should have depth 0"
-assert twist_uds_prune[0] == 0
+assert mod3_entry(flip_uds_prune, 0) == 0, "Solved state should have depth 0"
+assert mod3_entry(twist_uds_prune, 0) == 0
 print("OK: Pruning tables consistent")
 
+# Phase 2 tables: every packed nibble should match a fresh BFS
+from solver.move_tables import get_cperm_move, get_ud_edges_move, get_udslice_sorted_move
+from solver.pruning_tables import (
+    _bfs_depths, get_cperm_udslice_sorted_prune,
+    get_ud_edges_udslice_sorted_prune, nibble_entry,
+)
+for prune, a_move, n_a in (
+        (get_cperm_udslice_sorted_prune(), get_cperm_move(), coord.N_CPERM),
+        (get_ud_edges_udslice_sorted_prune(), get_ud_edges_move(), coord.N_UD_EDGES)):
+    depths = _bfs_depths(a_move, get_udslice_sorted_move(), n_a, coord.N_UDSLICE_SORTED)
+    assert all(nibble_entry(prune, i) == d for i, d in enumerate(depths)), \
+        "Nibble table should match BFS depths"
+print("OK: Phase 2 nibble tables match BFS depths")
+
 # Test 10: Full solve
 print("\n=== Test 10: Full solve ===")
 t0 = time.time()
@@ -146,4 +161,31 @@ if result:
 else:
     print(f"No solution found in {elapsed:.2f}s")
 
+# Test 12: Successively shorter solutions
+print("\n=== Test 12: solve_iter ===")
+from solver.solver import solve_iter
+
+g1_moves = "U R2 D' F2 L2 U2 B2 D R2 U' F2 L2".split()  # starts in G1
+for moves in (scramble_moves, g1_moves):
+    start = CubieCube()
+    for m in moves:
+        start.apply_move(MOVE_CUBES[move_map[m]])
+    lengths = []
+    for result in solve_iter(start, timeout=10, improve_timeout=0.5):
+        c = start.copy()
+        for m in result["moves"]:
+            c.apply_move(MOVE_CUBES[move_map[m]])
+        assert c.is_solved(), "Every solution should solve the cube!"
+        lengths.append(len(result["moves"]))
+    print(f"{' '.join(moves)}: lengths {lengths}")
+    assert lengths, "solve_iter should find a solution"
+    assert all(a > b for a, b in zip(lengths, lengths[1:])), \
+        "Solutions should get strictly shorter"
+print("OK: Solutions verified and strictly shorter")
+
+from solver.search import TwoPhaseSearch
+assert list(TwoPhaseSearch().solve_iter(CubieCube())) == [([], 0)], \
+    "A solved cube should give one empty solution"
+print("OK: Solved cube gives one empty solution")
+
 print("\n=== ALL TESTS PASSED ===")
@@ -4,8 +4,45 @@ Uses only Ursina Text and Button elements without background panels
 to avoid z-fighting/flickering.
 """
 
+from functools import lru_cache, partial
+
 from ursina import *
 
+# Vertical positions of the two control rows
+_ROW1_Y = -0.34
+_ROW2_Y = -0.42
+
+
+def _style(col):
+    """(color, highlight_color, pressed_color) of a button of color col."""
+    return col, col.tint(0.1), col.tint(-0.1)
+
+
+# Button color triples by state name, tints computed once at import
+_BTN_STATES = {
+    'azure': _style(color.azure),
+    'gray': _style(color.rgb32(80, 80, 90)),
+    'green': _style(color.rgb32(50, 180, 50)),
+    'orange': _style(color.orange),
+    'red': _style(color.rgb32(200, 50, 50)),
+    'purple': _style(color.rgb32(120, 60, 180)),
+}
+
+
+def _set_state(btn, state):
+    """Recolor btn, keeping its hover and pressed colors in step."""
+    btn.color, btn.highlight_color, btn.pressed_color = _BTN_STATES[state]
+
+
+def _noop(*args, **kwargs):
+    """Default for callbacks left unset, so handlers call them unconditionally."""
+
+
+@lru_cache(maxsize=256)
+def _step_text(current, total):
+    """Step counter text, memoized: solves replay the same small pairs."""
+    return f'Etape: {current}/{total}'
+
 
 class UIPanel:
     """Bottom panel with all UI controls."""
@@ -14,197 +51,247 @@ class UIPanel:
                  on_speed_change=None, on_mode_change=None,
                  on_pause=None, on_resume=None, on_step=None,
                  on_undo=None):
-        self.on_scramble = on_scramble
-        self.on_solve = on_solve
-        self.on_reset = on_reset
-        self.on_speed_change = on_speed_change
-        self.on_mode_change = on_mode_change
-        self.on_pause = on_pause
-        self.on_resume = on_resume
-        self.on_step = on_step
-        self.on_undo = on_undo
+        self.on_scramble = on_scramble or _noop
+        self.on_solve = on_solve or _noop
+        self.on_reset = on_reset or _noop
+        self.on_speed_change = on_speed_change or _noop
+        self.on_mode_change = on_mode_change or _noop
+        self.on_pause = on_pause or _noop
+        self.on_resume = on_resume or _noop
+        self.on_step = on_step or _noop
+        self.on_undo = on_undo or _noop
 
         self._paused = False
+        # Set by the controller while a solution is being animated
+        self.playing = False
         self._mode = 'Manuel'
+        # Last text written to each display, to skip redundant re-renders
+        self._shown = {}
+        # Texts set since the last flush(), by display
+        self._pending = {}
+        # Common parent of every control, so the panel is one subtree of
+        # camera.ui rather than a dozen siblings
+        self.ui_root = Entity(parent=camera.ui)
         self._build_ui()
 
-    def _btn(self, text, pos, scale, col, on_click):
-        """Helper to create a button with consistent style."""
+    def _btn(self, text, pos, scale, state, on_click):
+        """Helper to create a button with consistent style (see _BTN_STATES)."""
+        col, highlight, pressed = _BTN_STATES[state]
         return Button(
             text=text,
-            parent=camera.ui,
+            parent=self.ui_root,
             position=pos,
             scale=scale,
             color=col,
-            highlight_color=col.tint(0.1),
-            pressed_color=col.tint(-0.1),
+            highlight_color=highlight,
+            pressed_color=pressed,
             on_click=on_click,
         )
 
     def _build_ui(self):
-        row1_y = -0.34
-        row2_y = -0.42
+        row1_y = _ROW1_Y
+        row2_y = _ROW2_Y
 
         # --- Row 1: Mode + Speed ---
-        Text('Mode:', parent=camera.ui, position=(-0.84, row1_y + 0.012),
+        Text('Mode:', parent=self.ui_root, position=(-0.84, row1_y + 0.012),
              scale=0.9, color=color.light_gray)
         self.mode_btn = self._btn('Manuel', (-0.70, row1_y), (0.16, 0.05),
-                                  color.azure, self._toggle_mode)
+                                  'azure', self._toggle_mode)
 
-        Text('Vitesse:', parent=camera.ui, position=(-0.42, row1_y + 0.012),
+        Text('Vitesse:', parent=self.ui_root, position=(-0.42, row1_y + 0.012),
              scale=0.9, color=color.light_gray)
 
         self._speed_btns = []
+        # Index of the highlighted speed button ('Normal' at start)
+        self._active_speed_idx = 2
         speeds = [('Instant', 0), ('Rapide', 0.05), ('Normal', 0.3), ('Lent', 0.8)]
         for i, (label, val) in enumerate(speeds):
-            c = color.azure if i == 2 else color.rgb32(80, 80, 90)
+            state = 'azure' if i == self._active_speed_idx else 'gray'
             btn = self._btn(label, (-0.28 + i * 0.13, row1_y), (0.11, 0.045),
-                            c, Func(self._set_speed, i, val))
+                            state, partial(self._set_speed, i, val))
             self._speed_btns.append(btn)
 
         # --- Row 2: Actions ---
+        # The callbacks are fixed at construction, so they are the buttons'
+        # on_click handlers themselves
         self.scramble_btn = self._btn(
             'Melanger', (-0.72, row2_y), (0.18, 0.05),
-            color.orange, self._on_scramble_click)
+            'orange', self.on_scramble)
         self.solve_btn = self._btn(
             'Resoudre (IA)', (-0.48, row2_y), (0.22, 0.05),
-            color.rgb32(50, 180, 50), self._on_solve_click)
+            'green', self.on_solve)
         self.reset_btn = self._btn(
             'Reset', (-0.22, row2_y), (0.12, 0.05),
-            color.rgb32(200, 50, 50), self._on_reset_click)
+            'red', self.on_reset)
         self.undo_btn = self._btn(
             'Annuler', (-0.06, row2_y), (0.14, 0.05),
-            color.rgb32(120, 60, 180), self._on_undo_click)
+            'purple', self.on_undo)
 
-        # Playback controls
-        self.pause_btn = self._btn(
-            '||', (0.16, row2_y), (0.06, 0.05),
-            color.rgb32(80, 80, 90), self._toggle_pause)
-        self.step_fwd_btn = self._btn(
-            '>|', (0.24, row2_y), (0.06, 0.05),
-            color.rgb32(80, 80, 90), self._on_step_click)
+        # Playback controls, only built once needed (see
+        # show_playback_controls())
+        self.pause_btn = None
+        self.step_fwd_btn = None
 
         # --- Info texts ---
         self.moves_text = Text(
             text='',
-            parent=camera.ui,
+            parent=self.ui_root,
             position=(-0.84, -0.48),
             scale=0.8,
             color=color.rgb32(200, 200, 220),
         )
         self.step_text = Text(
             text='',
-            parent=camera.ui,
+            parent=self.ui_root,
             position=(0.40, -0.48),
             scale=0.8,
             color=color.yellow,
         )
-        self.status_text = Text(
-            text='Pret. Touches U/D/R/L/F/B pour tourner (Shift=inverse). Souris pour orbiter.',
-            parent=camera.ui,
+        # Key help, fixed, with the status line below it: set_status() only
+        # re-lays out the short status messages
+        Text(
+            text='Touches U/D/R/L/F/B pour tourner (Shift=inverse). Souris pour orbiter.',
+            parent=self.ui_root,
             position=(-0.84, 0.37),
             scale=0.8,
             color=color.rgb32(160, 160, 180),
         )
+        self.status_text = Text(
+            text='Pret.',
+            parent=self.ui_root,
+            position=(-0.84, 0.33),
+            scale=0.8,
+            color=color.rgb32(160, 160, 180),
+        )
 
         # --- Educational annotations (right side) ---
         self.phase_title_text = Text(
             text='',
-            parent=camera.ui,
+            parent=self.ui_root,
             position=(0.30, 0.28),
             scale=1.2,
             color=color.yellow,
         )
         self.phase_desc_text = Text(
             text='',
-            parent=camera.ui,
+            parent=self.ui_root,
             position=(0.30, 0.21),
             scale=0.75,
             color=color.rgb32(190, 190, 200),
         )
         self.move_desc_text = Text(
             text='',
-            parent=camera.ui,
+            parent=self.ui_root,
             position=(0.30, 0.05),
             scale=1.0,
             color=color.white,
         )
 
+    def show_playback_controls(self):
+        """Show the pause and step buttons, building them on first use."""
+        if self.pause_btn is None:
+            self.pause_btn = self._btn(
+                '||', (0.16, _ROW2_Y), (0.06, 0.05),
+                'gray', self._toggle_pause)
+            self.step_fwd_btn = self._btn(
+                '>|', (0.24, _ROW2_Y), (0.06, 0.05),
+                'gray', self.on_step)
+        else:
+            self.pause_btn.enabled = True
+            self.step_fwd_btn.enabled = True
+
+    def hide_playback_controls(self):
+        """Hide the pause and step buttons, unless playback is paused (the
+        pause button is then the only way to resume)."""
+        if self.pause_btn is None or self._paused:
+            return
+        self.pause_btn.enabled = False
+        self.step_fwd_btn.enabled = False
+
     def _toggle_mode(self):
         if self._mode == 'Manuel':
             self._mode = 'IA'
             self.mode_btn.text = 'IA'
-            self.mode_btn.color = color.rgb32(50, 180, 50)
+            _set_state(self.mode_btn, 'green')
+            self.show_playback_controls()
         else:
             self._mode = 'Manuel'
             self.mode_btn.text = 'Manuel'
-            self.mode_btn.color = color.azure
-        if self.on_mode_change:
-            self.on_mode_change(self._mode)
+            _set_state(self.mode_btn, 'azure')
+            # During playback the controls stay until it ends (see
+            # AppController._on_solve_done)
+            if not self.playing:
+                self.hide_playback_controls()
+        self.on_mode_change(self._mode)
 
     def _set_speed(self, idx, val):
-        for i, btn in enumerate(self._speed_btns):
-            btn.color = color.azure if i == idx else color.rgb32(80, 80, 90)
-        if self.on_speed_change:
-            self.on_speed_change(val)
+        # Only the previously and newly selected buttons change color
+        if idx != self._active_speed_idx:
+            _set_state(self._speed_btns[self._active_speed_idx], 'gray')
+            _set_state(self._speed_btns[idx], 'azure')
+            self._active_speed_idx = idx
+        self.on_speed_change(val)
 
     def _toggle_pause(self):
         self._paused = not self._paused
         if self._paused:
             self.pause_btn.text = '>'
-            self.pause_btn.color = color.rgb32(50, 180, 50)
-            if self.on_pause:
-                self.on_pause()
+            _set_state(self.pause_btn, 'green')
+            self.on_pause()
         else:
             self.pause_btn.text = '||'
-            self.pause_btn.color = color.rgb32(80, 80, 90)
-            if self.on_resume:
-                self.on_resume()
-
-    def _on_scramble_click(self):
-        if self.on_scramble:
-            self.on_scramble()
-
-    def _on_solve_click(self):
-        if self.on_solve:
-            self.on_solve()
+            _set_state(self.pause_btn, 'gray')
+            self.on_resume()
 
-    def _on_reset_click(self):
-        if self.on_reset:
-            self.on_reset()
+    def _set_text(self, name, text):
+        """Queue `text` for display `name`; flush() applies it.
+        Only the latest text queued for a display before a flush is rendered.
+        """
+        self._pending[name] = text
 
-    def _on_undo_click(self):
-        if self.on_undo:
-            self.on_undo()
+    def flush(self):
+        """Apply the queued texts. Call once per frame.
 
-    def _on_step_click(self):
-        if self.on_step:
-            self.on_step()
+        Setting Text.text rebuilds its glyphs, so each display is re-rendered
+        at most once per frame, and not at all when it already shows its text.
+        """
+        if not self._pending:
+            return
+        shown = self._shown
+        for name, text in self._pending.items():
+            if shown.get(name) != text:
+                shown[name] = text
+                getattr(self, name).text = text
+        self._pending.clear()
 
     def set_moves_display(self, moves_str):
         if len(moves_str) > 90:
             moves_str = '...' + moves_str[-87:]
-        self.moves_text.text = f'Moves: {moves_str}'
+        self._set_text('moves_text', f'Moves: {moves_str}')
 
-    def set_step_display(self, current, total):
-        self.step_text.text = f'Etape: {current}/{total}'
+    def update_progress(self, current, total, phase_title, phase_desc,
+                        move_text):
+        """Show solution step current/total with its phase and move texts."""
+        pending = self._pending
+        pending['step_text'] = _step_text(current, total)
+        pending['phase_title_text'] = phase_title
+        pending['phase_desc_text'] = phase_desc
+        pending['move_desc_text'] = move_text
 
     def set_status(self, text):
-        self.status_text.text = text
+        self._set_text('status_text', text)
 
     def set_phase_display(self, title, desc):
-        self.phase_title_text.text = title
-        self.phase_desc_text.text = desc
+        self._set_text('phase_title_text', title)
+        self._set_text('phase_desc_text', desc)
 
     def set_move_description(self, text):
-        self.move_desc_text.text = text
+        self._set_text('move_desc_text', text)
 
     def clear_displays(self):
-        self.moves_text.text = ''
-        self.step_text.text = ''
-        self.phase_title_text.text = ''
-        self.phase_desc_text.text = ''
-        self.move_desc_text.text = ''
+        for name in ('moves_text', 'step_text', 'phase_title_text',
+                     'phase_desc_text', 'move_desc_text'):
+            self._set_text(name, '')
 
     @property
     def mode(self):